@@ -0,0 +1,31 @@
+"""Benchmark of the time needed to build a detached tree of elements.
+
+Run from the repository root using ``python benchmarks/build.py``.
+"""
+
+import time
+from collections.abc import Callable
+
+from slash.core import Elem
+from slash.html import Span, Table, Td, Tr
+
+N = 10_000  # number of rows, each row consisting of 5 elements
+
+
+def measure(name: str, build: Callable[[], Elem], repeat: int = 5) -> None:
+    build()  # warm up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<24} {best * 1e3:>8.1f} ms ({best / (5 * N) * 1e6:.2f} µs per element)")
+
+
+def main() -> None:
+    measure("report table", lambda: Table([Tr(Td(f"row {i}"), Td(Span("x")), Td([Span("a"), "b"])) for i in range(N)]))
+    measure("nested sequences", lambda: Table(*[[Tr(Td("a"), Td([Span("b"), "c"])), Tr()] for _ in range(N)]))
+
+
+if __name__ == "__main__":
+    main()
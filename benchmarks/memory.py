@@ -0,0 +1,44 @@
+"""Benchmark of the memory used per mounted element.
+
+Run from the repository root using ``python benchmarks/memory.py``.
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from slash._server import Client, Server
+from slash.core import Elem, Session
+from slash.html import Div, Span, Td, Tr
+
+N = 50_000
+
+
+async def discard(data: str) -> None:
+    pass
+
+
+def measure(name: str, create: Callable[[], Elem]) -> None:
+    session = Session(Server(), Client(discard))
+    with session:
+        gc.collect()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        root = Div([create() for _ in range(N)]).mount()
+        session._queue_messages.clear()  # only count the elements, not the messages
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(f"{name:<24} {(after - before) / N:>8.1f} bytes per element")
+    del root
+
+
+def main() -> None:
+    measure("Td()", lambda: Td())
+    measure("Span(text)", lambda: Span("text"))
+    measure("Tr(Td(text), Td(text))", lambda: Tr(Td("a"), Td("b")))
+    measure("Elem(tag)", lambda: Elem("div"))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,9 @@ import re
 import traceback
 from collections.abc import Callable
 from ssl import SSLContext
+from urllib.parse import urlencode
 
+from slash._cache import CachedPage, CachedRoot, PageCache, UncacheablePageException
 from slash._logging import LOGGER
 from slash._message import Message
 from slash._pages import page_404
@@ -15,11 +17,16 @@ from slash.events import (
     ChangeEvent,
     ClickEvent,
     InputEvent,
+    ScrollEvent,
     SupportsOnChange,
     SupportsOnClick,
     SupportsOnInput,
+    SupportsOnScroll,
+    SupportsOnToggle,
+    ToggleEvent,
 )
 from slash.html import Code, Pre
+from slash.reactive import Profiler, enable_profiler
 
 
 class BadMessageException(Exception):
@@ -35,7 +42,13 @@ class App:
         ssl_context: SSL context to use for the web server.
         enable_upload: Boolean flag indicating whether file upload is enabled.
         max_upload_size: Maximum file size for uploaded files in bytes.
-        debug: Flag indicating whether debug information is logged.
+        cache_size: Maximum number of pages stored for cacheable routes.
+        cache_ttl: Time in seconds after which a page of a cacheable route is rendered again.
+        short_ids: Flag indicating whether elements get short ids, counting up per session,
+            instead of random ids. Short ids reduce the size of messages.
+        debug: Flag indicating whether debug information is logged. In debug mode, the reactive graph
+            is profiled, and the computed values and effects that took the most time are logged
+            whenever a client disconnects.
     """
 
     def __init__(
@@ -46,6 +59,9 @@ class App:
         ssl_context: SSLContext | None = None,
         enable_upload: bool = True,
         max_upload_size: int = 10_000_000,  # 10 MB
+        cache_size: int = 64,
+        cache_ttl: float = 300.0,  # 5 minutes
+        short_ids: bool = False,
         debug: bool = False,
     ) -> None:
         self._server = Server(
@@ -56,11 +72,15 @@ class App:
             max_upload_size=max_upload_size,
         )
         self._routes: dict[str | re.Pattern, Callable[..., Elem]] = {}
+        self._cached_routes: set[str | re.Pattern] = set()
+        self._page_cache = PageCache(cache_size, cache_ttl)
+        self._short_ids = short_ids
         self._sessions: dict[str, Session] = {}
+        self._profiler: Profiler | None = enable_profiler() if debug else None
 
         LOGGER.setLevel(logging.DEBUG if debug else logging.INFO)
 
-    def add_route(self, pattern: str, root: Callable[..., Elem]) -> None:
+    def add_route(self, pattern: str, root: Callable[..., Elem], *, cache: bool = False) -> None:
         """Add route from a path pattern.
 
         Args:
@@ -68,21 +88,48 @@ class App:
             root: Function that returns the root element of the page.
                 If `pattern` is a :py:class:`re.Pattern`, the matched groups will
                 be provided to the function as arguments.
+            cache: Flag indicating whether the page is static, in which case it is rendered
+                once per path and query, and replayed to every session that visits it.
+                The page of a cached route cannot depend on the session, and its
+                elements cannot have event handlers. If they do, a warning is logged and
+                the route is rendered for every session instead.
         """
         is_regex = any(c in pattern for c in ".^$*+?{}[]\\|()")
-        self._routes[re.compile(f"^{pattern}$") if is_regex else pattern] = root
+        key = re.compile(f"^{pattern}$") if is_regex else pattern
+        self._routes[key] = root
+        if cache:
+            self._cached_routes.add(key)
+        else:
+            self._cached_routes.discard(key)
 
     def _create_root(self) -> Elem:
         """Create a root element from the current client state."""
         session = Session.require()
         for pattern, root in self._routes.items():
             if isinstance(pattern, str) and pattern == session.location.path:
-                return root()
+                return self._render(pattern, root, ())
             if isinstance(pattern, re.Pattern):
                 if (m := pattern.match(session.location.path)) is not None:
-                    return root(*m.groups())
+                    return self._render(pattern, root, m.groups())
         return page_404()
 
+    def _render(self, pattern: str | re.Pattern, root: Callable[..., Elem], args: tuple[str, ...]) -> Elem:
+        """Create a root element for a route, using the page cache if the route is cacheable."""
+        if pattern not in self._cached_routes:
+            return root(*args)
+        location = Session.require().location
+        key = location.path + "?" + urlencode(sorted(location.query.items()))
+        if (page := self._page_cache.get(key)) is None:
+            try:
+                page = CachedPage.render(lambda: root(*args), self._server, location)
+            except UncacheablePageException as err:
+                # Render the route for every session from now on
+                LOGGER.warning(f"Route '{location.path}' cannot be cached: {err}")
+                self._cached_routes.discard(pattern)
+                return root(*args)
+            self._page_cache.put(key, page)
+        return CachedRoot(page)
+
     def run(self) -> None:
         """Run the application."""
         self._server.on_ws_connect(self._handle_ws_connect)
@@ -93,6 +140,8 @@ class App:
     async def _handle_ws_connect(self, client: Client) -> None:
         # Create and store new session instance for client
         session = Session(self._server, client)
+        session._router = self._create_root
+        session._short_ids = self._short_ids
         self._sessions[client.id] = session
 
     async def _handle_ws_message(self, client: Client, data: str) -> None:
@@ -120,6 +169,12 @@ class App:
                 # `change` event
                 elif message.event == "change":
                     self._handle_change_message(message)
+                # `toggle` event
+                elif message.event == "toggle":
+                    self._handle_toggle_message(message)
+                # `scroll` event
+                elif message.event == "scroll":
+                    self._handle_scroll_message(message)
                 # `popstate` event
                 elif message.event == "popstate":
                     self._handle_popstate_message(message)
@@ -133,6 +188,8 @@ class App:
     async def _handle_ws_disconnect(self, client: Client) -> None:
         # Forget session corresponding to client and call on disconnect method
         session = self._sessions.pop(client.id)
+        if self._profiler is not None:
+            LOGGER.debug(f"Reactive profile:\n{self._profiler.report()}")
         session._on_disconnect()
 
     def _handle_data_message(self, client: Client, message: Message) -> None:
@@ -155,12 +212,12 @@ class App:
             msg = f"Error in `load` event: expected `url` of type string, but got `{type(url).__name__}`."
             raise BadMessageException(msg)
         try:
-            session._location = Location(url)  # NOTE: not very clean, but effective
+            Location(url)
         except Exception as err:
             msg = f"Error in `load` event: invalid `url` (`{url}`)."
             raise BadMessageException(msg) from err
 
-        Session.require().set_root(self._create_root())
+        session._route(url)
 
     def _handle_click_message(self, message: Message) -> None:
         """Handle click event."""
@@ -189,7 +246,41 @@ class App:
             raise BadMessageException(msg)
         elem.change(ChangeEvent(elem, message.data["value"]))
 
+    def _handle_toggle_message(self, message: Message) -> None:
+        """Handle toggle event."""
+        id = message.data["id"]
+        elem = Session.require().get_elem(id)
+        if not isinstance(elem, SupportsOnToggle):
+            msg = f"Error in `toggle` event: element '{id}' does not support toggle."
+            raise BadMessageException(msg)
+        elem.toggle(ToggleEvent(elem, bool(message.data["open"])))
+
+    def _handle_scroll_message(self, message: Message) -> None:
+        """Handle scroll event."""
+        id = message.data["id"]
+        elem = Session.require().get_elem(id)
+        if not isinstance(elem, SupportsOnScroll):
+            msg = f"Error in `scroll` event: element '{id}' does not support scroll."
+            raise BadMessageException(msg)
+        elem.scroll(ScrollEvent(elem, float(message.data["top"]), float(message.data["height"])))
+
     def _handle_popstate_message(self, message: Message) -> None:
         """Handle popstate event."""
+        session = Session.require()
         state = message.data["state"]
-        Session.require().history.popstate(PopStateEvent(state=state))
+        url = message.data.get("url")
+        if url is not None:
+            if not isinstance(url, str):
+                msg = f"Error in `popstate` event: expected `url` of type string, but got `{type(url).__name__}`."
+                raise BadMessageException(msg)
+            try:
+                location = Location(url)
+            except Exception as err:
+                msg = f"Error in `popstate` event: invalid `url` (`{url}`)."
+                raise BadMessageException(msg) from err
+            # If the path changed, the page of the new location must be shown
+            if location.path != session.location.path:
+                session._route(url)
+                return
+            session._location = location  # NOTE: not very clean, but effective
+        session.history.popstate(PopStateEvent(state=state))
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Self
+
+from slash._server import Client, Server
+from slash._utils import random_id
+from slash.core import Elem, Location, Session
+
+# Matches the contents of JSON strings, which are the candidates for element ids
+_JSON_STRING = re.compile(r'(?<=")([^"\\]+)(?=")')
+
+
+async def _discard(data: str) -> None:
+    pass
+
+
+class UncacheablePageException(Exception):
+    """Raised when a page cannot be cached, because it depends on the session it is rendered in."""
+
+
+class CachedPage:
+    """Pre-rendered page, stored as the stream of messages that creates it.
+
+    Args:
+        messages: Serialized messages that create the page.
+        ids: Ids occurring in the messages that must be replaced by fresh ids when replayed.
+        root_id: Id of the root element of the page.
+    """
+
+    def __init__(self, messages: list[str], ids: set[str], root_id: str) -> None:
+        self._root_id = root_id
+        self._ids = ids
+        # Split messages into literal parts (even indices) and ids (odd indices)
+        self._templates: list[list[str]] = []
+        for message in messages:
+            parts = []
+            start = 0
+            for m in _JSON_STRING.finditer(message):
+                if m.group() in ids:
+                    parts.append(message[start : m.start()])
+                    parts.append(m.group())
+                    start = m.end()
+            parts.append(message[start:])
+            self._templates.append(parts)
+
+    @staticmethod
+    def render(root: Callable[[], Elem], server: Server, location: Location) -> CachedPage:
+        """Render page in a separate session, and record the messages that create it.
+
+        Args:
+            root: Function that returns the root element of the page.
+            server: Server instance.
+            location: Location of the page.
+
+        Raises:
+            UncacheablePageException: If an element of the page has event handlers, or the page
+                created tasks, reactive bindings or leave handlers, which would not exist for the
+                sessions that the page is replayed to.
+        """
+        recorder = Session(server, Client(_discard))
+        recorder._location = location
+        with recorder:
+            elem = root()
+            elem.mount()
+        if recorder._tasks or recorder._onleave_handlers:
+            msg = "page created tasks" if recorder._tasks else "page has reactive bindings or leave handlers"
+            recorder._leave_page()  # stop the tasks and bindings, which would keep updating the recorder
+            raise UncacheablePageException(msg)
+        for mounted in recorder._mounted_elems.values():
+            if events := [name for name in mounted.attrs() if name.startswith("on")]:
+                msg = f"element {mounted.id} ({mounted.tag}) has event handlers for {', '.join(events)}"
+                raise UncacheablePageException(msg)
+        ids = set(recorder._mounted_elems) | recorder._functions
+        return CachedPage(recorder._queue_messages, ids, elem.id)
+
+    def replay(self, new_id: Callable[[], str] = random_id) -> tuple[list[str], str]:
+        """Create the messages of the page with fresh ids.
+
+        Args:
+            new_id: Function that generates a fresh id.
+
+        Returns:
+            Tuple containing the list of serialized messages and the id of the root element.
+        """
+        mapping = {id: new_id() for id in self._ids}
+        messages = [
+            "".join(mapping[part] if i % 2 else part for i, part in enumerate(parts)) for parts in self._templates
+        ]
+        return messages, mapping[self._root_id]
+
+
+class CachedRoot(Elem):
+    """Root element whose contents are replayed from a cached page.
+
+    The elements of the page only exist on the client, so the page cannot contain event handlers.
+
+    Args:
+        page: Cached page to replay.
+    """
+
+    __slots__ = ("_page",)
+
+    def __init__(self, page: CachedPage) -> None:
+        super().__init__("div")
+        self._page = page
+
+    def _mount(self, session: Session) -> Self:
+        # If already mounted, raise exception
+        if self._session is not None:
+            raise Exception(f"Element {self.id} already mounted")
+
+        # Send messages of cached page
+        messages, self._id = self._page.replay(session._new_id)
+        session._queue_messages.extend(messages)
+
+        # Mark as mounted
+        session._mounted_elems[self.id] = self
+        self._session = session
+
+        return self
+
+
+class PageCache:
+    """Cache of pre-rendered pages with least-recently-used eviction and time-to-live.
+
+    Args:
+        max_size: Maximum number of pages in the cache.
+        ttl: Time in seconds after which a cached page expires.
+    """
+
+    def __init__(self, max_size: int = 64, ttl: float = 300.0) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._pages: OrderedDict[str, tuple[float, CachedPage]] = OrderedDict()
+
+    def get(self, key: str) -> CachedPage | None:
+        """Get cached page, or `None` if no (unexpired) page is cached under the given key."""
+        if (entry := self._pages.get(key)) is None:
+            return None
+        expires, page = entry
+        if expires < time.monotonic():
+            del self._pages[key]
+            return None
+        self._pages.move_to_end(key)
+        return page
+
+    def put(self, key: str, page: CachedPage) -> None:
+        """Store page in the cache under the given key."""
+        self._pages[key] = (time.monotonic() + self._ttl, page)
+        self._pages.move_to_end(key)
+        while len(self._pages) > self._max_size:
+            self._pages.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all pages from the cache."""
+        self._pages.clear()
@@ -7,5 +7,5 @@ def page_404() -> Elem:
     return Column(
         H1("Page not found!"),
         Div("Oops, this page does not exist.."),
-        Button("👈 Back to homepage").onclick(lambda: Session.require().set_location("/")),
+        Button("👈 Back to homepage").onclick(lambda: Session.require().navigate("/")),
     ).style({"margin": "auto", "max-width": "512px", "align-items": "center", "gap": "8px"})
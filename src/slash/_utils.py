@@ -3,13 +3,27 @@ import string
 
 _seed = random.randint(0, 2**32 - 1)
 
+_CHARS = string.digits + string.ascii_letters
+_PAIRS = [a + b for a in _CHARS for b in _CHARS]  # all two-character strings, in base-62 order
+
 
 def random_id() -> str:
+    """Generate a unique, hard to guess id of 7 characters."""
     global _seed
     _seed += 1
     return "_" + _int32_to_str(_feistel32(_seed))
 
 
+def short_id(n: int) -> str:
+    """Convert a counter to a short id, by base-62 encoding it.
+
+    Ids of counters below 62, 3844 and 238328 are 2, 3 and 4 characters long, respectively.
+    """
+    if n < 3844:
+        return "_" + (_CHARS[n] if n < 62 else _PAIRS[n])
+    return short_id(n // 3844) + _PAIRS[n % 3844]
+
+
 def _feistel32(x: int) -> int:
     x = (x ^ (x >> 16)) * 0xBF58476D1CE4E5B9
     x &= 0xFFFFFFFF
@@ -20,13 +34,8 @@ def _feistel32(x: int) -> int:
 
 
 def _int32_to_str(n: int) -> str:
-    chars = string.digits + string.ascii_letters
-    base = len(chars)
-    result = []
-    for _ in range(6):
-        n, r = divmod(n, base)
-        result.append(chars[r])
-    return "".join(reversed(result))
+    # Six base-62 digits, looked up two at a time
+    return _PAIRS[n // 14776336 % 3844] + _PAIRS[n // 3844 % 3844] + _PAIRS[n % 3844]
 
 
 def default_color(index: int) -> str:
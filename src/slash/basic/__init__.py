@@ -6,6 +6,7 @@ from slash.basic._confirm import confirm
 from slash.basic._data_table import DataTable
 from slash.basic._download import Download
 from slash.basic._icon import Icon
+from slash.basic._keyed_list import KeyedList
 from slash.basic._latex import LaTeX
 from slash.basic._loading import Loading
 from slash.basic._markdown import Markdown
@@ -16,6 +17,7 @@ from slash.basic._svg import SVG, SVGElem
 from slash.basic._tabs import Tabs
 from slash.basic._tooltip import Tooltip
 from slash.basic._upload import Upload
+from slash.basic._virtual_list import VirtualList
 
 __all__: list[str] = [
     "Axes",
@@ -27,6 +29,7 @@ __all__: list[str] = [
     "FillBetween",
     "Graph",
     "Icon",
+    "KeyedList",
     "LaTeX",
     "Loading",
     "Markdown",
@@ -40,4 +43,5 @@ __all__: list[str] = [
     "Tabs",
     "Tooltip",
     "Upload",
+    "VirtualList",
 ]
@@ -53,6 +53,33 @@ class Axes(SVG):
         height: Height of the figure in pixels.
     """
 
+    __slots__ = (
+        "_width",
+        "_height",
+        "_view",
+        "_plots",
+        "_color_counter",
+        "_title",
+        "_xlabel",
+        "_ylabel",
+        "_legend",
+        "_grid",
+        "_xmin",
+        "_xmax",
+        "_ymin",
+        "_ymax",
+        "_svg_plots",
+        "_svg_defs",
+        "_clip_plots_id",
+        "_svg_axes",
+        "_svg_legend",
+        "_svg_ticks",
+        "_svg_grid",
+        "_svg_labels",
+        "_xticks",
+        "_yticks",
+    )
+
     def __init__(self, *, width: int = 384, height: int = 256) -> None:
         super().__init__()
 
@@ -13,6 +13,8 @@ class Checkbox(Elem, SupportsOnClick):
         disabled: Flag indicating if checkbox is disabled.
     """
 
+    __slots__ = ("_label", "_checked", "_disabled", "_onclick_handlers")
+
     def __init__(self, label: str | Elem = "", *, checked: bool = False, disabled: bool = False) -> None:
         super().__init__("label")
         self.label = label
@@ -20,6 +20,25 @@ class DataTable(Elem):
         max_rows: Maximum number of rows displayed at once.
     """
 
+    __slots__ = (
+        "_keys",
+        "_labels",
+        "_max_rows",
+        "_table",
+        "_controls",
+        "_controls_first",
+        "_controls_prev",
+        "_controls_span",
+        "_controls_next",
+        "_controls_last",
+        "_data",
+        "_index",
+        "_sort_key",
+        "_sort_asc",
+        "_sort_indices",
+        "_table_header",
+    )
+
     def __init__(
         self,
         keys: Sequence[str],
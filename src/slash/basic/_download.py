@@ -13,6 +13,8 @@ class Download(Elem):
         text: Text shown on the button.
     """
 
+    __slots__ = ("_path",)
+
     def __init__(self, path: Path, *, text: str = "Download") -> None:
         super().__init__("a")
         self._path = path
@@ -15,6 +15,8 @@ class Icon(Elem):
             :py:const:`download`.
     """
 
+    __slots__ = ("_icon",)
+
     def __init__(self, icon: str) -> None:
         super().__init__("span")
         self._icon = icon
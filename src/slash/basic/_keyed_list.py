@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import Generic, Self, TypeVar
+
+from slash._message import Message
+from slash.core import ChildList, Elem
+
+T = TypeVar("T")
+
+
+class KeyedList(Elem, Generic[T]):
+    """Element whose children are rendered from a sequence of items, identified by key.
+
+    When the items are updated, the elements of items whose keys did not change are reused,
+    and only the minimal set of elements is created, moved and removed. An item is assumed to
+    be unchanged as long as its key is unchanged.
+
+    Args:
+        items: Sequence of items.
+        key: Function that returns the key of an item. Keys must be hashable and unique.
+        render: Function that creates the element for an item.
+        tag: HTML tag of the element.
+    """
+
+    __slots__ = ("_key", "_render", "_keys", "_items", "_elems")
+
+    def __init__(
+        self,
+        items: Iterable[T] = (),
+        *,
+        key: Callable[[T], Hashable],
+        render: Callable[[T], Elem],
+        tag: str = "div",
+    ) -> None:
+        super().__init__(tag)
+        self._key = key
+        self._render = render
+        self._keys: list[Hashable] = []  # keys of the items, in order
+        self._items: dict[Hashable, T] = {}  # items by key
+        self._elems: dict[Hashable, Elem] = {}  # elements by key
+        self.set_items(items)
+
+    @property
+    def items(self) -> Sequence[T]:
+        return tuple(self._items[key] for key in self._keys)
+
+    @items.setter
+    def items(self, items: Iterable[T]) -> None:
+        self.set_items(items)
+
+    def get_elem(self, key: Hashable) -> Elem | None:
+        """Get the element rendered for the item with the given key.
+
+        Args:
+            key: Key of the item.
+
+        Returns:
+            Element of the item, or `None` if there is no item with the given key.
+        """
+        return self._elems.get(key)
+
+    def get_index(self, key: Hashable) -> int | None:
+        """Get the index of the item with the given key.
+
+        Args:
+            key: Key of the item.
+
+        Returns:
+            Index of the item, or `None` if there is no item with the given key.
+        """
+        if key not in self._elems:
+            return None
+        return self._keys.index(key)
+
+    def set_items(self, items: Iterable[T]) -> Self:
+        """Set items, and update the children accordingly.
+
+        Args:
+            items: Sequence of items.
+        """
+        items = list(items)
+        keys = [self._key(item) for item in items]
+        if len(set(keys)) != len(keys):
+            msg = "Keys of items in `KeyedList` must be unique"
+            raise ValueError(msg)
+
+        # Remove elements of keys that are gone
+        new_keys = set(keys)
+        for key, elem in self._elems.items():
+            if key not in new_keys:
+                if elem.is_mounted():
+                    elem.unmount()
+                elem._parent = None
+
+        # Reuse existing elements and render new ones
+        old_index = {key: i for i, key in enumerate(k for k in self._keys if k in new_keys)}
+        elems = {key: self._elems[key] if key in old_index else self._render(item) for key, item in zip(keys, items)}
+        self._keys = keys
+        self._items = dict(zip(keys, items))
+        self._elems = elems
+
+        # Update children on the server
+        self._children = ChildList()
+        for elem in elems.values():
+            if elem._parent is not None and elem._parent is not self:
+                elem._parent.children._remove(elem)
+            elem._parent = self
+            self._children._append(elem)
+
+        if (session := self._session) is None:
+            return self
+
+        # Elements whose old order is preserved (a longest increasing subsequence) need not move
+        stable = _longest_increasing_subsequence(keys, old_index)
+
+        # New elements at the end are appended in order
+        end = len(keys)
+        while end > 0 and keys[end - 1] not in old_index:
+            end -= 1
+        for key in keys[end:]:
+            elems[key]._mount(session)
+
+        # Place other new and moved elements, from right to left, before their next sibling,
+        # which is already in place
+        for i in range(end - 1, -1, -1):
+            key = keys[i]
+            if key in stable:
+                continue
+            elem = elems[key]
+            if key not in old_index:
+                elem._mount(session)  # appended to the end
+            if i + 1 < len(keys):
+                session.send(Message.update(elem.id, parent=self.id, before=elems[keys[i + 1]].id))
+            else:
+                session.send(Message.update(elem.id, parent=self.id))
+
+        return self
+
+    def set_item(self, item: T) -> Self:
+        """Set an item. The item with the same key is replaced in place, otherwise the item is appended.
+
+        Only the element of the item is rendered and sent, regardless of the number of items.
+
+        Args:
+            item: Item to set.
+        """
+        key = self._key(item)
+        if key not in self._elems:
+            return self.splice_items(len(self._keys), 0, [item])
+        old = self._elems[key]
+        self._items[key] = item
+        self._elems[key] = elem = self._render(item)
+        self._replace_elem(old, elem)
+        return self
+
+    def remove_item(self, key: Hashable) -> Self:
+        """Remove the item with the given key, if any.
+
+        Args:
+            key: Key of the item.
+        """
+        if key in self._elems:
+            self.splice_items(self._keys.index(key), 1)
+        return self
+
+    def splice_items(self, index: int, count: int, items: Iterable[T] = ()) -> Self:
+        """Replace a range of items, and update only the children of the affected items.
+
+        Args:
+            index: Index of the first item to replace.
+            count: Number of items to replace.
+            items: Items to insert at the given index.
+        """
+        items = list(items)
+        keys = [self._key(item) for item in items]
+        removed_keys = self._keys[index : index + count]
+        if len(set(keys)) != len(keys) or any(key in self._elems and key not in removed_keys for key in keys):
+            msg = "Keys of items in `KeyedList` must be unique"
+            raise ValueError(msg)
+
+        # Update items and elements
+        old_elems = [self._elems.pop(key) for key in removed_keys]
+        for key in removed_keys:
+            del self._items[key]
+        elems = [self._render(item) for item in items]
+        self._keys[index : index + count] = keys
+        self._items.update(zip(keys, items))
+        self._elems.update(zip(keys, elems))
+
+        # Replace elements pairwise, which keeps the positions of all other children, and then
+        # remove or insert the remaining elements
+        n = min(len(old_elems), len(elems))
+        for old, elem in zip(old_elems[:n], elems[:n]):
+            self._replace_elem(old, elem)
+        for old in old_elems[n:]:
+            if old.is_mounted():
+                old.unmount()
+            else:
+                self.children._remove(old)
+                old._parent = None
+        if elems[n:]:
+            if index + n >= len(self.children):
+                self.append(elems[n:])
+            else:
+                self.insert(index + n, elems[n:])
+        return self
+
+    def _replace_elem(self, old: Elem, elem: Elem) -> None:
+        """Put element `elem` in place of child element `old`."""
+        if elem._parent is not None:
+            elem._parent.children._remove(elem)
+        elem._parent = self
+        old._parent = None
+        self.children._replace(old, elem)
+        if (session := self._session) is not None:
+            elem._mount(session)
+            session.send(Message.update(elem.id, parent=self.id, before=old.id))
+            old._unmount(session, remove=True)
+
+
+def _longest_increasing_subsequence(keys: list[Hashable], index: dict[Hashable, int]) -> set[Hashable]:
+    """Find keys that form a longest subsequence of `keys` whose `index` values are increasing."""
+    tails: list[int] = []  # tails[n] is the smallest last index of an increasing subsequence of length n + 1
+    tails_at: list[int] = []  # position in `keys` of the element ending at tails[n]
+    previous: dict[int, int] = {}  # position in `keys` of predecessor in subsequence
+    for i, key in enumerate(keys):
+        if key not in index:
+            continue
+        n = bisect_left(tails, index[key])
+        if n > 0:
+            previous[i] = tails_at[n - 1]
+        if n == len(tails):
+            tails.append(index[key])
+            tails_at.append(i)
+        else:
+            tails[n] = index[key]
+            tails_at[n] = i
+    result: set[Hashable] = set()
+    i = tails_at[-1] if tails_at else None
+    while i is not None:
+        result.add(keys[i])
+        i = previous.get(i)
+    return result
@@ -13,6 +13,8 @@ class LaTeX(HTML):
         display: If true, math is rendered display style, otherwise inline math.
     """
 
+    __slots__ = ("_display",)
+
     def __init__(self, latex: str, *, display: bool = False) -> None:
         super().__init__("")
         self._display = display
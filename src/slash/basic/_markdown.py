@@ -12,6 +12,8 @@ class Markdown(HTML):
         markdown: String of markdown to be formatted as HTML.
     """
 
+    __slots__ = ()
+
     def __init__(self, markdown: str) -> None:
         super().__init__("")
         self.set_markdown(markdown)
@@ -17,6 +17,8 @@ class Pie(SVG):
         height: Height of figure in pixels.
     """
 
+    __slots__ = ("_width", "_height", "_color_counter", "_title", "_legend", "_gap", "_radius")
+
     def __init__(self, *, width: int = 384, height: int = 256) -> None:
         super().__init__()
 
@@ -10,6 +10,8 @@ class Progress(Elem):
         text: Text in the center of the progress bar. Defaults to the percentage of progress.
     """
 
+    __slots__ = ("_span", "_value", "_text")
+
     def __init__(self, value: float = 0.0, text: str | None = None):
         super().__init__("div", span := Span())
         self.add_class("slash-progress")
@@ -15,6 +15,8 @@ class SVGElem(Elem):
         attrs: Additional attribute values.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         tag: str,
@@ -28,6 +30,8 @@ class SVGElem(Elem):
 class SVG(SVGElem):
     """HTML ``<svg>`` element."""
 
+    __slots__ = ()
+
     def __init__(self, *children: Children, **attrs: Any):
         super().__init__("svg", *children, **attrs)
         self.set_attr("xmlns", "http://www.w3.org/2000/svg")
@@ -1,6 +1,9 @@
-from slash.core import Elem
+from collections.abc import Callable, Mapping
+
+from slash.core import Children, Elem
 from slash.events import ChangeEvent, SupportsOnChange
 from slash.html import Div
+from slash.layout import Lazy
 
 
 class Tabs(Elem, SupportsOnChange):
@@ -9,9 +12,23 @@ class Tabs(Elem, SupportsOnChange):
     Args:
         labels: List of labels for the tabs.
         value: Label of currently selected tab.
+        panels: Mapping of functions that create the contents of the tabs, indexed by label.
+            The contents of a tab are only created when the tab is first selected, and are
+            shown in the :py:attr:`panels` element.
+        unmount_after: If set, the contents of a tab are unmounted after the tab has been
+            deselected for this number of seconds.
     """
 
-    def __init__(self, labels: list[str], *, value: str | None = None) -> None:
+    __slots__ = ("_labels", "_lazy_panels", "_panels", "_value", "_onchange_handlers")
+
+    def __init__(
+        self,
+        labels: list[str],
+        *,
+        value: str | None = None,
+        panels: Mapping[str, Callable[[], Children]] | None = None,
+        unmount_after: float | None = None,
+    ) -> None:
         super().__init__(
             "div",
             *[Div(label).onclick(lambda event: self._onclick_tab(event.target)) for label in labels],
@@ -20,11 +37,20 @@ class Tabs(Elem, SupportsOnChange):
         self.add_class("slash-tabs")
 
         self._labels = labels
+        self._lazy_panels = {
+            label: Lazy(render, unmount_after=unmount_after) for label, render in (panels or {}).items()
+        }
+        self._panels = Div(list(self._lazy_panels.values())).add_class("slash-tab-panels")
         self.value = value or labels[0]
 
     def _onclick_tab(self, tab: Elem) -> None:
         self.value = tab.text
 
+    @property
+    def panels(self) -> Elem:
+        """Element containing the contents of the tabs."""
+        return self._panels
+
     @property
     def value(self) -> str:
         return self._value
@@ -40,4 +66,9 @@ class Tabs(Elem, SupportsOnChange):
                     child.add_class("selected")
                 else:
                     child.remove_class("selected")
+        for label, panel in self._lazy_panels.items():
+            if label == self.value:
+                panel.reveal()
+            elif panel.revealed:
+                panel.conceal()
         self.change(ChangeEvent(self, self.value))
@@ -58,6 +58,8 @@ class Tooltip(Elem):
         target: Target element. The tooltip will be shown when the target element is hovered.
     """
 
+    __slots__ = ("_target",)
+
     def __init__(self, *children: Children, target: Elem) -> None:
         super().__init__("div", *children, Div().add_class("slash-tip"))
         self.add_class("slash-tooltip")
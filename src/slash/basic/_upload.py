@@ -58,6 +58,8 @@ class Upload(Elem):
         multiple: Flag indicating if uploading multiple files at once is allowed.
     """
 
+    __slots__ = ("_label_id", "_input_id", "_onupload_handlers")
+
     def __init__(self, *, text: str = "Drop files or click to upload", multiple: bool = False) -> None:
         super().__init__("form", method="POST")
         self.add_class("slash-upload")
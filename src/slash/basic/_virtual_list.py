@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from typing import Self
+
+from slash.core import Elem
+from slash.events import ScrollEvent, SupportsOnScroll
+from slash.html import Div
+
+
+class VirtualList(Elem, SupportsOnScroll):
+    """Scrollable list of rows, of which only the visible rows are created and mounted.
+
+    Rows are rendered on demand as the list is scrolled, and unmounted once they are scrolled
+    out of view. All rows have the same height.
+
+    Args:
+        count: Number of rows.
+        row_height: Height of a row in pixels.
+        render: Function that creates the element for the row with the given index.
+        height: Height of the list in pixels.
+        overscan: Number of rows to mount above and below the visible rows.
+    """
+
+    __slots__ = (
+        "_content",
+        "_row_height",
+        "_render",
+        "_overscan",
+        "_top",
+        "_height",
+        "_rows",
+        "_count",
+        "_onscroll_handlers",
+    )
+
+    def __init__(
+        self,
+        count: int,
+        *,
+        row_height: int,
+        render: Callable[[int], Elem],
+        height: int = 400,
+        overscan: int = 5,
+    ) -> None:
+        super().__init__("div", content := Div().style({"position": "relative"}))
+        self.add_class("slash-virtual-list")
+        self.style({"height": f"{height}px", "overflow-y": "auto"})
+        self.onscroll(self._handle_scroll)
+
+        self._content = content
+        self._row_height = row_height
+        self._render = render
+        self._overscan = overscan
+        self._top = 0.0
+        self._height = float(height)
+        self._rows: dict[int, Elem] = {}
+
+        self._count = 0
+        self.set_count(count)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @count.setter
+    def count(self, count: int) -> None:
+        self.set_count(count)
+
+    def set_count(self, count: int) -> Self:
+        """Set the number of rows.
+
+        Args:
+            count: Number of rows.
+        """
+        self._count = count
+        self._top = max(0.0, min(self._top, count * self._row_height - self._height))  # as clamped by the client
+        self._content.style({"height": f"{count * self._row_height}px"})
+        self._update_rows()
+        return self
+
+    @property
+    def visible_rows(self) -> range:
+        """Range of indices of the rows that are currently mounted."""
+        start = max(0, math.floor(self._top / self._row_height) - self._overscan)
+        stop = min(self._count, math.ceil((self._top + self._height) / self._row_height) + self._overscan)
+        return range(start, max(start, stop))
+
+    def refresh(self) -> Self:
+        """Render all visible rows again."""
+        for index in list(self._rows):
+            self._remove_row(index)
+        self._update_rows()
+        return self
+
+    def _handle_scroll(self, event: ScrollEvent) -> None:
+        self._top = event.top
+        self._height = event.height
+        self._update_rows()
+
+    def _update_rows(self) -> None:
+        visible = self.visible_rows
+        for index in [index for index in self._rows if index not in visible]:
+            self._remove_row(index)
+        for index in visible:
+            if index not in self._rows:
+                row = self._render(index).style(
+                    {
+                        "position": "absolute",
+                        "top": f"{index * self._row_height}px",
+                        "height": f"{self._row_height}px",
+                        "left": "0",
+                        "right": "0",
+                    }
+                )
+                self._rows[index] = row
+                self._content.append(row)
+
+    def _remove_row(self, index: int) -> None:
+        row = self._rows.pop(index)
+        if row.is_mounted():
+            row.unmount()
+        elif row.parent is not None:
+            row.parent.children._remove(row)
+            row._parent = None
@@ -0,0 +1,211 @@
+"""This module contains the Slash component model.
+
+A :py:class:`Component` is an element whose contents are rendered from props by a render
+function. When the props change, the contents are rendered again, and the new contents are
+compared to the previous contents, so that only the changed attributes, text and children
+are sent to the client. If the props are equal to the previous props, nothing is rendered.
+
+    >>> def counter(count: int) -> Elem:
+    >>>     return Div(Span(f"Count: {count}"), Button("+1").onclick(lambda: view.set_props(count + 1)))
+    >>>
+    >>> view = Component(counter, 0)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Generic, Self, TypeVar
+
+from slash._message import Message
+from slash.core import ChildList, Elem, Session
+
+P = TypeVar("P")
+
+
+class Component(Elem, Generic[P]):
+    """Element whose contents are rendered from props.
+
+    Args:
+        render: Function that returns an element from props.
+        props: Initial props.
+    """
+
+    __slots__ = ("_render", "_props", "_content")
+
+    def __init__(self, render: Callable[[P], Elem], props: P) -> None:
+        super().__init__("div", content := render(props))
+        self.style({"display": "contents"})
+        self._render = render
+        self._props = props
+        self._content = content
+
+    @property
+    def props(self) -> P:
+        return self._props
+
+    @props.setter
+    def props(self, props: P) -> None:
+        self.set_props(props)
+
+    def set_props(self, props: P) -> Self:
+        """Set props, and render the contents again if the props changed.
+
+        Args:
+            props: New props.
+        """
+        if props == self._props:
+            return self
+        self._props = props
+        return self.refresh()
+
+    def refresh(self) -> Self:
+        """Render the contents again, regardless of whether the props changed."""
+        old, new = self._content, self._render(self._props)
+        self._content = new
+        if (session := self._session) is None:
+            self.clear()
+            self.append(new)
+            return self
+
+        # Put new contents in place of the old contents, and update the client accordingly
+        old._parent = None
+        new._parent = self
+        self._children = ChildList()
+        self._children._append(new)
+        _park_reused(new, self, session)
+        _patch(old, new, session)
+        return self
+
+
+def _park_reused(elem: Elem, parking: Elem, session: Session) -> None:
+    """Move the mounted elements that the render function reused into `parking` on the client.
+
+    Until they are put in place, reused elements remain where the old contents are, which may
+    be removed or cleared first.
+    """
+    stack = [elem]
+    while stack:
+        elem = stack.pop()
+        if elem._session is session:
+            session.send(Message.update(elem.id, parent=parking.id))
+        else:
+            stack.extend(child for child in elem._children or () if isinstance(child, Elem))
+
+
+def _mount_child(child: Elem, parent: Elem, session: Session) -> None:
+    """Mount `child` as the last child of `parent`, or move it there if it was reused."""
+    if child._session is session:
+        session.send(Message.update(child.id, parent=parent.id))
+    else:
+        child._mount(session)
+
+
+def _patch(old: Elem, new: Elem, session: Session) -> None:
+    """Update the client from the mounted element `old` to the unmounted element `new`.
+
+    Where possible, `new` takes over the id of `old` and only the differences are sent.
+    Otherwise, `new` is mounted right before `old`, and `old` is removed.
+    """
+    if old is new:  # contents that were reused by the render function are unchanged
+        return
+    if new._session is session:  # reused element that is mounted elsewhere
+        assert new._parent is not None
+        session.send(Message.update(new.id, parent=new._parent.id, before=old.id))
+        old._unmount(session, remove=True)
+        return
+    if (
+        type(old) is not type(new)
+        or old.tag != new.tag
+        or old._onmount_handlers
+        or old._onunmount_handlers
+        or new._onmount_handlers
+        or new._onunmount_handlers
+    ):
+        new._mount(session)
+        assert new._parent is not None
+        session.send(Message.update(new.id, parent=new._parent.id, before=old.id))
+        old._unmount(session, remove=True)
+        return
+
+    # Let `new` take over the id and mounted state of `old`
+    old_attrs = old.attrs()
+    new._id = old._id
+    new._session = session
+    old._session = None
+    session._mounted_elems[new.id] = new
+
+    # Send changed attributes
+    if changes := _diff_attrs(old_attrs, new.attrs()):
+        session.send(Message.update(new.id, **changes))
+
+    _patch_children(old, new, session)
+
+
+def _diff_attrs(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+    """Compute the attribute values to send to change attributes `old` into `new`."""
+    changes: dict[str, Any] = {}
+    for name in {**old, **new}:
+        if name in ("tag", "id", "parent"):
+            continue
+        old_value, new_value = old.get(name), new.get(name)
+        if name == "style":
+            old_style, new_style = old_value or {}, new_value or {}
+            style = {key: None for key in old_style if key not in new_style}
+            style.update({key: value for key, value in new_style.items() if old_style.get(key) != value})
+            if style:
+                changes["style"] = style
+        elif name == "class":
+            old_classes, new_classes = (old_value or "").split(), (new_value or "").split()
+            if removed := [name for name in old_classes if name not in new_classes]:
+                changes["remove_class"] = removed
+            if added := [name for name in new_classes if name not in old_classes]:
+                changes["add_class"] = added
+        elif old_value != new_value:
+            changes[name] = new_value
+    return changes
+
+
+def _patch_children(old: Elem, new: Elem, session: Session) -> None:
+    """Update the client from the children of `old` to the children of `new`."""
+    old_children, new_children = list(old._children or ()), list(new._children or ())
+    n = min(len(old_children), len(new_children))
+
+    # Children match pairwise if they are of the same kind, and strings are equal
+    if all(
+        (isinstance(a, Elem) and isinstance(b, Elem)) or (isinstance(a, str) and a == b)
+        for a, b in zip(old_children[:n], new_children[:n])
+    ) and all(isinstance(a, Elem) for a in old_children[n:]):
+        for a, b in zip(old_children[:n], new_children[:n]):
+            if isinstance(a, Elem) and isinstance(b, Elem):
+                _patch(a, b, session)
+        for a in old_children[n:]:
+            assert isinstance(a, Elem)
+            a._unmount(session, remove=True)
+        for b in new_children[n:]:
+            if isinstance(b, Elem):
+                _mount_child(b, new, session)
+            else:
+                session.send(Message("create", parent=new.id, text=b))
+        return
+
+    # Single text child can be set directly
+    if len(new_children) == 1 and isinstance(new_children[0], str):
+        for a in old_children:
+            if isinstance(a, Elem):
+                a._unmount(session, remove=False)
+        session.send(Message.update(new.id, text=new_children[0]))
+        return
+
+    # Otherwise, replace all children
+    for a in old_children:
+        if isinstance(a, Elem):
+            a._unmount(session, remove=False)
+    session.send(Message.clear(new.id))
+    for b in new_children:
+        if isinstance(b, Elem):
+            _mount_child(b, new, session)
+        else:
+            session.send(Message("create", parent=new.id, text=b))
+
+
+__all__ = ["Component"]
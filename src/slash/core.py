@@ -6,18 +6,19 @@ import asyncio
 import inspect
 import traceback
 from asyncio import Future, Task
-from collections.abc import Awaitable, Callable, Mapping, Sequence
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Mapping, Sequence
 from contextvars import ContextVar, Token
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from types import MappingProxyType
-from typing import Any, Literal, Self, TypeAlias, TypeVar
-from urllib.parse import parse_qsl, urlparse
+from typing import Any, Literal, Self, TypeAlias, TypeVar, overload
+from urllib.parse import parse_qsl, urljoin, urlparse
 
 from slash._logging import LOGGER
 from slash._message import Message
 from slash._server import Client, Server, UploadEvent
-from slash._utils import random_id
+from slash._utils import random_id, short_id
 from slash.js import JSFunction
 
 # Types
@@ -56,6 +57,13 @@ class Session:
         self._files: list[str] = []  # urls of files that are currently shared
         self._upload_callbacks: list[str] = []  # urls of endpoints that accept file uploads
         self._root: Elem | None = None
+        self._router: Callable[[], Elem] | None = None  # creates root element for current location
+        self._suppressed_updates = 0  # number of updates not sent because nothing changed
+        self._short_ids = False  # whether elements mounted in this session get short ids
+        self._id_counter = 0  # counter for short ids
+        self._ondisconnect_handlers: list[Callable[[], Any]] = []
+        self._onleave_handlers: list[Callable[[], Any]] = []
+        self._onflush_handlers: list[Callable[[], Any]] = []
 
         self._location = Location("")
         self._history = History()
@@ -103,6 +111,19 @@ class Session:
             self._id = id
         return self._id
 
+    def _new_id(self) -> str:
+        """Generate id for an element that is mounted in this session."""
+        if not self._short_ids:
+            return random_id()
+        self._id_counter += 1
+        return short_id(self._id_counter)
+
+    @property
+    def suppressed_updates(self) -> int:
+        """Number of attribute, style, class and text updates that were not sent to the client
+        because the values did not change."""
+        return self._suppressed_updates
+
     @property
     def location(self) -> Location:
         """Session location instance."""
@@ -119,10 +140,15 @@ class Session:
         Args:
             root: Element to set as root element.
         """
-        if self._root is not None:
+        if self._root is not None and self._root.is_mounted():
             self._root.unmount()
+        self._root = None
+        try:
+            root.mount()
+        except Exception:
+            _discard_partially_mounted(root, self)
+            raise
         self._root = root
-        root.mount()
 
     def get_elem(self, id: str) -> Elem | None:
         """Get element by id.
@@ -192,6 +218,11 @@ class Session:
 
     async def flush(self) -> None:
         """Send all queued messages to the client."""
+        # Call flush handlers, which may queue more messages
+        with self:
+            for handler in list(self._onflush_handlers):
+                handler()
+
         # Clean tasks
         self._clean_tasks()
 
@@ -268,11 +299,14 @@ class Session:
         if inspect.isawaitable(result):
             self.create_task(result)
 
-    def create_task(self, coroutine: Awaitable[None]) -> None:
+    def create_task(self, coroutine: Awaitable[None]) -> Task:
         """Create task in the context of the session.
 
         Args:
             coroutine: Awaitable function to run.
+
+        Returns:
+            Task instance, which can be used to cancel the task.
         """
 
         async def wrapper(session: Session, coroutine: Awaitable[None]) -> None:
@@ -285,7 +319,49 @@ class Session:
                 await session.flush()
 
         task = asyncio.create_task(wrapper(self, coroutine))
+        task.add_done_callback(lambda _: _close_unstarted(coroutine))
         self._tasks.append(task)
+        return task
+
+    def onflush(self, handler: Callable[[], Any]) -> None:
+        """Add handler to be called every time before the queued messages are sent to the client.
+
+        Args:
+            handler: Handler to call before sending messages.
+        """
+        self._onflush_handlers.append(handler)
+
+    def ondisconnect(self, handler: Callable[[], Any]) -> None:
+        """Add handler to be called when the client disconnects.
+
+        Args:
+            handler: Handler to call when the client disconnects.
+        """
+        self._ondisconnect_handlers.append(handler)
+
+    def onleave(self, handler: Callable[[], Any]) -> None:
+        """Add handler to be called once when the current page is left, either because the client
+        navigates to another page or because the client disconnects.
+
+        Args:
+            handler: Handler to call when the page is left.
+        """
+        self._onleave_handlers.append(handler)
+
+    def _leave_page(self) -> None:
+        """Cancel the tasks of the current page, except the running task, and call the leave handlers."""
+        try:
+            current = asyncio.current_task()
+        except RuntimeError:  # no running event loop
+            current = None
+        for task in self._tasks:
+            if task is not current and not task.done():
+                task.cancel("page left")
+        self._tasks = [task for task in self._tasks if task is current]
+        handlers, self._onleave_handlers = self._onleave_handlers, []
+        with self:
+            for handler in handlers:
+                handler()
 
     def cancel_tasks(self, msg: str | None = None) -> None:
         """Cancel all tasks associated with this session."""
@@ -368,11 +444,55 @@ class Session:
     def set_location(self, url: str) -> None:
         """Navigate to location.
 
+        This reloads the page in the browser. To navigate without reloading, use :py:meth:`navigate`.
+
         Args;
             url: URL to navigate to.
         """
         self.send(Message(event="location", url=url))
 
+    def navigate(self, url: str) -> None:
+        """Navigate to location within the application, without reloading the page.
+
+        The URL is pushed onto the browser history, and the root element is replaced
+        by the root element of the page at the new location.
+
+        A URL on another origin, or any URL when the application has no router, is loaded
+        by the browser instead, as with :py:meth:`set_location`.
+
+        Args:
+            url: URL to navigate to.
+        """
+        current, target = urlparse(self._location.url), urlparse(urljoin(self._location.url, url))
+        if self._router is None or (target.scheme, target.netloc) != (current.scheme, current.netloc):
+            self.set_location(url)
+            return
+        self._route(url)
+        self.send(Message(event="history", push=None, url=self._location.url))
+
+    def _route(self, url: str) -> None:
+        """Set location and replace root element by the page at that location.
+
+        If the page cannot be created, the page of the previous location is shown again,
+        and the error is raised.
+        """
+        assert self._router is not None
+        previous = self._location
+        had_page = self._root is not None
+        self._leave_page()
+        self._location = Location(urljoin(previous.url, url))
+        self._history = History()  # handlers of previous page no longer apply
+        try:
+            self.set_root(self._router())
+        except Exception:
+            if had_page:
+                self._leave_page()
+                self._location = previous
+                self._history = History()
+                self.set_root(self._router())
+                self.send(Message(event="history", replace=None, url=previous.url))
+            raise
+
     def set_data(self, key: str, value: str | None) -> None:
         """Set value in local storage.
 
@@ -397,12 +517,18 @@ class Session:
     def _on_disconnect(self) -> None:
         # Cancel all tasks
         self.cancel_tasks("client disconnected")
+        # Call leave handlers of the current page
+        self._leave_page()
         # Unshare all files
         for url in self._files:
             self._server.unshare_file(url)
         # Unaccept all uploads
         for url in self._upload_callbacks:
             self._server.unaccept_file(url)
+        # Call disconnect handlers
+        with self:
+            for handler in self._ondisconnect_handlers:
+                handler()
 
 
 # Attributes
@@ -424,6 +550,9 @@ class Attr(property):
         return getattr(elem, self._private)
 
     def _set(self, elem: Elem, value: Any):
+        if hasattr(elem, self._private) and getattr(elem, self._private) == value:
+            elem._suppress_update()
+            return
         setattr(elem, self._private, value)
         elem._update_attrs({self._name: value})
 
@@ -442,6 +571,8 @@ class MountEvent:
         target: Element that was mounted.
     """
 
+    __slots__ = ("_target",)
+
     def __init__(self, target: Elem) -> None:
         self._target = target
 
@@ -458,6 +589,8 @@ class UnmountEvent:
         target: Element that was unmounted.
     """
 
+    __slots__ = ("_target",)
+
     def __init__(self, target: Elem) -> None:
         self._target = target
 
@@ -470,6 +603,128 @@ class UnmountEvent:
 # Elements
 
 
+class ChildList(Sequence["Elem | str"]):
+    """Read-only view of the children of an element.
+
+    Children are kept in order, and elements can be looked up and removed in constant
+    time. The view reflects later changes to the children, so to modify the children
+    while iterating, iterate over a copy such as ``list(elem.children)``.
+    """
+
+    __slots__ = ("_items", "_slots", "_count")
+
+    INDEX_THRESHOLD = 32  # number of children above which children are indexed
+
+    def __init__(self) -> None:
+        # A few children are stored in a list. Many children are stored in an (ordered)
+        # dictionary, keyed by the child element itself or by a unique integer for strings.
+        # Once an element is replaced in place, all children are keyed by unique integers,
+        # along with the integer of every child element.
+        self._items: list[Elem | str] | dict[Elem | int, Elem | str] = []
+        self._slots: dict[Elem, int] | None = None  # allocated when an element is replaced
+        self._count = 0
+
+    def _key(self, child: Elem | str) -> Elem | int:
+        if isinstance(child, Elem) and self._slots is None:
+            return child
+        self._count += 1
+        if isinstance(child, Elem):
+            assert self._slots is not None
+            self._slots[child] = self._count
+        return self._count
+
+    def _index(self, children: list[Elem | str]) -> None:
+        """Store children in a dictionary instead of a list."""
+        self._items = {self._key(child): child for child in children}
+
+    def _values(self) -> Iterable[Elem | str]:
+        return self._items if isinstance(self._items, list) else self._items.values()
+
+    def _append(self, child: Elem | str) -> None:
+        if isinstance(self._items, dict):
+            self._items[self._key(child)] = child
+            return
+        self._items.append(child)
+        if len(self._items) > ChildList.INDEX_THRESHOLD:
+            self._index(self._items)
+
+    def _extend(self, children: list[Elem | str]) -> None:
+        if isinstance(self._items, list) and len(self._items) + len(children) <= ChildList.INDEX_THRESHOLD:
+            self._items.extend(children)
+            return
+        for child in children:
+            self._append(child)
+
+    def _insert(self, position: int, child: Elem | str) -> None:
+        if isinstance(self._items, list):
+            self._items.insert(position, child)
+            if len(self._items) > ChildList.INDEX_THRESHOLD:
+                self._index(self._items)
+        elif position >= len(self._items):
+            self._items[self._key(child)] = child
+        else:
+            keys, values = list(self._items), list(self._items.values())
+            keys.insert(position, self._key(child))
+            values.insert(position, child)
+            self._items = dict(zip(keys, values))
+
+    def _remove(self, elem: Elem) -> None:
+        if isinstance(self._items, list):
+            self._items.remove(elem)
+        elif self._slots is None:
+            del self._items[elem]
+        else:
+            del self._items[self._slots.pop(elem)]
+
+    def _replace(self, old: Elem, new: Elem) -> None:
+        """Put element `new` in place of child element `old`."""
+        if isinstance(self._items, list):
+            self._items[self._items.index(old)] = new
+            return
+        if self._slots is None:
+            # Key all children by unique integers, which can be kept when an element is replaced
+            self._slots = {}
+            self._index(list(self._items.values()))
+        slot = self._slots[new] = self._slots.pop(old)
+        self._items[slot] = new
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Elem | str]:
+        return iter(self._values())
+
+    def __contains__(self, child: object) -> bool:
+        if isinstance(self._items, dict) and isinstance(child, Elem):
+            return child in (self._items if self._slots is None else self._slots)
+        return child in self._values()
+
+    @overload
+    def __getitem__(self, index: int) -> Elem | str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Elem | str]: ...
+
+    def __getitem__(self, index: int | slice) -> Elem | str | list[Elem | str]:
+        if isinstance(self._items, list):
+            return self._items[index]
+        if isinstance(index, slice):
+            return list(self._items.values())[index]
+        if index < 0:
+            index += len(self._items)
+        if not 0 <= index < len(self._items):
+            raise IndexError("child index out of range")
+        return next(islice(self._items.values(), index, None))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ChildList | list | tuple):
+            return len(self) == len(other) and all(a is b or a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ChildList({list(self._values())!r})"
+
+
 class Elem:
     """Base class for all Slash elements.
 
@@ -480,6 +735,25 @@ class Elem:
         attrs: Additional attribute values.
     """
 
+    __slots__ = (
+        "_tag",
+        "_children",
+        "_attrs",
+        "_id",
+        "_parent",
+        "_session",
+        "_style",
+        "_classes",
+        "_onmount_handlers",
+        "_onunmount_handlers",
+    )
+
+    _attr_fields: tuple[Attr, ...] = ()  # attribute descriptors of the class, computed once per class
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._attr_fields = tuple(field for name in dir(cls) if isinstance(field := getattr(cls, name), Attr))
+
     def __init__(
         self,
         tag: str,
@@ -487,21 +761,25 @@ class Elem:
         **attrs: str | int,
     ) -> None:
         self._tag = tag
-        self._children: list[Elem | str] = []
-        self._attrs = attrs
+        self._children: ChildList | None = None  # allocated when needed
+        self._attrs: dict[str, Any] | None = attrs or None  # allocated when needed
 
-        self._id = random_id()
+        self._id: str | None = None  # generated when needed, or when mounted
         self._parent: Elem | None = None
-        self._style: dict[str, str | None] = {}
-        self._classes: set[str] = set()
+        self._session: Session | None = None  # session in which the element is mounted
+        self._style: dict[str, str | None] | None = None  # allocated when needed
+        self._classes: dict[str, None] | None = None  # ordered set of classes, allocated when needed
 
-        self._onmount_handlers: list[Handler[MountEvent]] = []
-        self._onunmount_handlers: list[Handler[UnmountEvent]] = []
+        self._onmount_handlers: list[Handler[MountEvent]] | None = None  # allocated when needed
+        self._onunmount_handlers: list[Handler[UnmountEvent]] | None = None  # allocated when needed
 
-        self.append(*children)
+        if children:
+            self._append_detached(children)
 
     @property
     def id(self) -> str:
+        if self._id is None:
+            self._id = random_id()
         return self._id
 
     @property
@@ -509,8 +787,11 @@ class Elem:
         return self._tag
 
     @property
-    def children(self) -> list[Elem | str]:
-        return list(self._children)
+    def children(self) -> ChildList:
+        """Read-only view of the children of the element."""
+        if self._children is None:
+            self._children = ChildList()
+        return self._children
 
     @property
     def parent(self) -> Elem | None:
@@ -525,8 +806,18 @@ class Elem:
                 the CSS attribute is set to that value. If a value is `None`, the
                 CSS attribute is reset.
         """
-        self._style.update(style)
-        self._update_attrs({"style": dict(style)})
+        if self._style is None:
+            self._style = {}
+        changes = {key: value for key, value in style.items() if self._style.get(key) != value}
+        if not changes:
+            self._suppress_update()
+            return self
+        for key, value in changes.items():
+            if value is None:
+                del self._style[key]
+            else:
+                self._style[key] = value
+        self._update_attrs({"style": changes})
         return self
 
     def attrs(self) -> dict[str, Any]:
@@ -539,9 +830,12 @@ class Elem:
             "tag": self.tag,
             "id": self.id,
             "parent": self.parent.id if self.parent is not None else "body",
-            **self._attrs,
         }
 
+        # Additional attributes
+        if self._attrs:
+            attrs.update(self._attrs)
+
         # Style
         if self._style:
             attrs["style"] = self._style
@@ -551,16 +845,14 @@ class Elem:
             attrs["class"] = " ".join(self._classes)
 
         # Attributes
-        for name in dir(type(self)):
-            field = getattr(type(self), name)
-            if isinstance(field, Attr):
-                value = getattr(self, name)
-                if value is None:
-                    continue
-                if callable(value):
-                    attrs[field.name] = True
-                else:
-                    attrs[field.name] = value
+        for field in self._attr_fields:
+            value = field._get(self)
+            if value is None:
+                continue
+            if callable(value):
+                attrs[field.name] = True
+            else:
+                attrs[field.name] = value
 
         return attrs
 
@@ -571,6 +863,11 @@ class Elem:
             name: Attribute name.
             value: Attribute value.
         """
+        if self._attrs is None:
+            self._attrs = {}
+        elif name in self._attrs and self._attrs[name] == value:
+            self._suppress_update()
+            return self
         self._attrs[name] = value
         self._update_attrs({name: value})
         return self
@@ -581,7 +878,7 @@ class Elem:
         Args:
             name: Attribute name.
         """
-        if name in self._attrs:
+        if self._attrs is not None and name in self._attrs:
             del self._attrs[name]
             self._update_attrs({name: None})
         return self
@@ -592,7 +889,7 @@ class Elem:
         Returns:
             Boolean indicating if element is mounted.
         """
-        return Session.require().get_elem(self.id) is self
+        return self._session is not None
 
     def onmount(self, handler: Handler[MountEvent]) -> Self:
         """Add event handler for mount event.
@@ -600,6 +897,8 @@ class Elem:
         Args:
             handler: Handler to be called when element is mounted.
         """
+        if self._onmount_handlers is None:
+            self._onmount_handlers = []
         self._onmount_handlers.append(handler)
         return self
 
@@ -609,33 +908,45 @@ class Elem:
         Args:
             handler: Handler to be called when element is unmounted.
         """
+        if self._onunmount_handlers is None:
+            self._onunmount_handlers = []
         self._onunmount_handlers.append(handler)
         return self
 
     def mount(self) -> Self:
         """Mount element."""
-        session = Session.require()
+        return self._mount(Session.require())
 
+    def _mount(self, session: Session) -> Self:
+        """Mount element in the given session."""
         # If already mounted, raise exception
-        if self.is_mounted():
+        if self._session is not None:
             raise Exception(f"Element {self.id} already mounted")
 
+        # Generate id
+        if self._id is None:
+            self._id = session._new_id()
+
         # Send create message
         session.send(Message(event="create", **self.attrs()))
 
         # Mount children
-        for child in self.children:
-            if isinstance(child, Elem):
-                child.mount()
+        for child in tuple(self._children or ()):
+            if isinstance(child, Elem) and child._session is session:
+                session.send(Message.update(child.id, parent=self.id))  # moved here while mounted
+            elif isinstance(child, Elem):
+                child._mount(session)
             else:
                 session.send(Message(event="create", parent=self.id, text=child))
 
         # Mark as mounted
         session._mounted_elems[self.id] = self
+        self._session = session
 
         # Call mount event handlers
-        for handler in self._onmount_handlers:
-            session.call_handler(handler, MountEvent(self))
+        if self._onmount_handlers is not None:
+            for handler in self._onmount_handlers:
+                session.call_handler(handler, MountEvent(self))
 
         return self
 
@@ -645,53 +956,69 @@ class Elem:
         Args:
             reset_parent: Flag indicating whether parent should be reset.
         """
-        session = Session.require()
+        session = self._session
 
         # If not yet mounted, raise exception
-        if not self.is_mounted():
+        if session is None:
             raise Exception(f"Element {self.id} was not mounted")
 
-        # Unmount children
-        for child in self.children:
-            if isinstance(child, Elem):
-                child.unmount(reset_parent=False)
-
         # Reset parent
         if reset_parent:
             if self._parent is not None:
-                self._parent._children.remove(self)
+                self._parent.children._remove(self)
                 self._parent = None
 
+        return self._unmount(session, remove=True)
+
+    def _unmount(self, session: Session, *, remove: bool) -> Self:
+        """Unmount element from the given session.
+
+        Args:
+            session: Session in which the element is mounted.
+            remove: Flag indicating whether to send a remove message. Descendants of a removed
+                element are removed by the client along with it, so they need no message.
+        """
+        # Unmount children
+        for child in tuple(self._children or ()):
+            if isinstance(child, Elem):
+                child._unmount(session, remove=False)
+
         # Unmark as mounted
         session._mounted_elems.pop(self.id)
+        self._session = None
 
         # Send remove message
-        session.send(Message.remove(self.id))
+        if remove:
+            session.send(Message.remove(self.id))
 
         # Call unmount hook
-        for handler in self._onunmount_handlers:
-            session.call_handler(handler, UnmountEvent(self))
+        if self._onunmount_handlers is not None:
+            for handler in self._onunmount_handlers:
+                session.call_handler(handler, UnmountEvent(self))
 
         return self
 
     def _update_attrs(self, attrs: dict[str, Any]) -> None:
         """Send message to client to update attribute values."""
-        if (session := Session.current()) is not None and self.is_mounted():
+        if (session := self._session) is not None:
             session.send(Message.update(self.id, **attrs))
 
+    def _suppress_update(self) -> None:
+        """Count an update that is not sent to the client because nothing changed."""
+        if (session := self._session) is not None:
+            session._suppressed_updates += 1
+
     def clear(self) -> Self:
         """Unmount all children."""
-        if self.is_mounted():
-            for child in self.children:
-                if isinstance(child, Elem):
-                    child.unmount()
-            if (session := Session.current()) is not None:
-                session.send(Message.clear(self.id))
-        else:
-            for child in self.children:
-                if isinstance(child, Elem):
-                    child._parent = None
-        self._children = []
+        children, self._children = self._children or (), None
+        session = self._session
+        for child in children:
+            if isinstance(child, Elem):
+                if session is not None and child._session is not None:
+                    child._unmount(session, remove=False)  # removed on client by clear message
+                child._parent = None
+        if session is not None:
+            session.send(Message.clear(self.id))
         return self
 
     def append(self, *children: Children) -> Self:
@@ -700,6 +1027,9 @@ class Elem:
         Args:
             children: Child or children to append. Either an element, string or list of elements and strings.
         """
+        if self._session is None:
+            self._append_detached(children)
+            return self
         for child in children:
             if isinstance(child, Elem) or isinstance(child, str):
                 self._append_or_insert_elem(child)
@@ -709,6 +1039,35 @@ class Elem:
                 raise TypeError(f"Expected child of type `Elem` or `str`, but got `{type(child)}`")
         return self
 
+    def _append_detached(self, children: Iterable[Children]) -> None:
+        """Append to the children of this element, while it is not mounted.
+
+        No messages need to be sent, so children are added directly, and nested sequences
+        of children are flattened without recursion.
+        """
+        flat: list[Elem | str] = []
+        stack = [iter(children)]
+        while stack:
+            for child in stack[-1]:
+                if isinstance(child, Elem):
+                    if child._parent is self and child not in (self._children or ()):
+                        flat.remove(child)  # same child given twice
+                    elif child._parent is not None:
+                        child._parent.children._remove(child)
+                    child._parent = self
+                    flat.append(child)
+                elif isinstance(child, str):
+                    flat.append(child)
+                elif isinstance(child, Sequence):
+                    stack.append(iter(child))
+                    break  # continue with the nested sequence, then resume this one
+                else:
+                    raise TypeError(f"Expected child of type `Elem` or `str`, but got `{type(child)}`")
+            else:
+                stack.pop()
+        if flat:
+            self.children._extend(flat)
+
     def insert(self, position: int, *children: Children) -> Self:
         """Insert into the children of this element at given position.
 
@@ -733,14 +1092,17 @@ class Elem:
         if isinstance(elem, Elem):
             # Set parent and children variables
             if elem._parent is not None:
-                elem._parent._children.remove(elem)
+                elem._parent.children._remove(elem)
             elem._parent = self
-            self._children.insert(position if position is not None else len(self._children), elem)
+            if position is None:
+                self.children._append(elem)
+            else:
+                self.children._insert(position, elem)
 
-            if (session := Session.current()) is not None and self.is_mounted():
+            if (session := self._session) is not None:
                 # If elem is not mounted yet, mount it
-                if not elem.is_mounted():
-                    elem.mount()
+                if elem._session is None:
+                    elem._mount(session)
                 # Otherwise, set new `parent` value (case `position` is none)
                 elif position is None:
                     session.send(Message.update(elem.id, parent=self.id))
@@ -750,8 +1112,11 @@ class Elem:
 
         if isinstance(elem, str):
             # Append or insert text
-            self._children.insert(position if position is not None else len(self._children), elem)
-            if (session := Session.current()) is not None and self.is_mounted():
+            if position is None:
+                self.children._append(elem)
+            else:
+                self.children._insert(position, elem)
+            if (session := self._session) is not None:
                 if position is not None:
                     session.send(Message("create", parent=self.id, text=elem))
                 else:
@@ -771,12 +1136,26 @@ class Elem:
     @property
     def text(self) -> str:
         """Element text contents."""
-        return "".join(child if isinstance(child, str) else child.text for child in self._children)
+        return "".join(child if isinstance(child, str) else child.text for child in self._children or ())
 
     @text.setter
     def text(self, text: str) -> None:
-        self.clear()
-        self.append(text)
+        if self._children is not None and len(self._children) == 1 and self._children[0] == text:
+            self._suppress_update()
+            return
+        if (session := self._session) is None:
+            self.clear()
+            self.append(text)
+            return
+        # Replace children by text in a single update, which also clears the element if the text is empty
+        children, self._children = self._children or (), ChildList()
+        for child in children:
+            if isinstance(child, Elem):
+                if child._session is not None:
+                    child._unmount(session, remove=False)  # removed on client by text update
+                child._parent = None
+        self._children._append(text)
+        session.send(Message.update(self.id, text=text))
 
     def set_text(self, text: str) -> Self:
         """Set the text content of the element."""
@@ -787,7 +1166,7 @@ class Elem:
         """HTML representation of element."""
         parts = []
         parts.append(f"<{self.tag}>")
-        for child in self._children:
+        for child in self._children or ():
             if isinstance(child, str):
                 parts.append(child)
             else:
@@ -801,23 +1180,52 @@ class Elem:
         Args:
             name: Name of class to add. Multiple names may be provided separated by spaces.
         """
-        self._classes.update(name.split(" "))
-        self._update_attrs({"class": " ".join(self._classes)})
+        if self._classes is None:
+            self._classes = {}
+        names = [name for name in dict.fromkeys(name.split()) if name not in self._classes]
+        if not names:
+            self._suppress_update()
+            return self
+        self._classes.update(dict.fromkeys(names))
+        self._update_attrs({"add_class": names})
         return self
 
     def remove_class(self, name: str) -> Self:
         """Remove one or more classes from element.
 
         Args:
-            name: Name of class to add. Multiple names may be provided separated by spaces.
+            name: Name of class to remove. Multiple names may be provided separated by spaces.
         """
-        for name in name.split(" "):
-            if name in self._classes:
-                self._classes.remove(name)
-        self._update_attrs({"class": " ".join(self._classes)})
+        classes = self._classes if self._classes is not None else {}
+        names = [name for name in dict.fromkeys(name.split()) if name in classes]
+        if not names:
+            self._suppress_update()
+            return self
+        for name in names:
+            del classes[name]
+        self._update_attrs({"remove_class": names})
         return self
 
 
+def _close_unstarted(coroutine: Awaitable[None]) -> None:
+    """Close a coroutine that never started, because its task was cancelled before it ran."""
+    if inspect.iscoroutine(coroutine) and inspect.getcoroutinestate(coroutine) == inspect.CORO_CREATED:
+        coroutine.close()
+
+
+def _discard_partially_mounted(root: Elem, session: Session) -> None:
+    """Unmark the descendants of an element whose mounting failed, and remove it from the client."""
+    stack = [root]
+    while stack:
+        elem = stack.pop()
+        if elem._session is session:
+            session._mounted_elems.pop(elem.id, None)
+            elem._session = None
+        stack.extend(child for child in elem._children or () if isinstance(child, Elem))
+    if root._id is not None:
+        session.send(Message.remove(root.id))
+
+
 # Types
 
 Children: TypeAlias = Elem | str | Sequence[Elem | str]
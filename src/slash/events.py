@@ -16,6 +16,8 @@ class ClickEvent:
         target: Element that was clicked.
     """
 
+    __slots__ = ("_target",)
+
     def __init__(self, target: Elem) -> None:
         self._target = target
 
@@ -28,10 +30,14 @@ class ClickEvent:
 class SupportsOnClick:
     """Mix-in class for `onclick` support."""
 
+    # Handlers are stored in a slot of the element class that mixes this class in
+    __slots__ = ()
+    _onclick_handlers: list[Handler[ClickEvent]]
+
     @property
     def onclick_handlers(self) -> list[Handler[ClickEvent]]:
         if not hasattr(self, "_onclick_handlers"):
-            self._onclick_handlers: list[Handler[ClickEvent]] = []
+            self._onclick_handlers = []
         return self._onclick_handlers
 
     def onclick(self, handler: Handler[ClickEvent]) -> Self:
@@ -65,6 +71,8 @@ class InputEvent:
         value: Value of the updated content.
     """
 
+    __slots__ = ("_target", "_value")
+
     def __init__(self, target: Elem, value: str) -> None:
         self._target = target
         self._value = value
@@ -83,10 +91,13 @@ class InputEvent:
 class SupportsOnInput:
     """Mix-in class for `oninput` support."""
 
+    __slots__ = ()
+    _oninput_handlers: list[Handler[InputEvent]]
+
     @property
     def oninput_handlers(self) -> list[Handler[InputEvent]]:
         if not hasattr(self, "_oninput_handlers"):
-            self._oninput_handlers: list[Handler[InputEvent]] = []
+            self._oninput_handlers = []
         return self._oninput_handlers
 
     def oninput(self, handler: Handler[InputEvent]) -> Self:
@@ -120,6 +131,8 @@ class ChangeEvent:
         value: Value of the changed content.
     """
 
+    __slots__ = ("_target", "_value")
+
     def __init__(self, target: Elem, value: str) -> None:
         self._target = target
         self._value = value
@@ -138,10 +151,13 @@ class ChangeEvent:
 class SupportsOnChange:
     """Mix-in class for `onchange` support."""
 
+    __slots__ = ()
+    _onchange_handlers: list[Handler[ChangeEvent]]
+
     @property
     def onchange_handlers(self) -> list[Handler[ChangeEvent]]:
         if not hasattr(self, "_onchange_handlers"):
-            self._onchange_handlers: list[Handler[ChangeEvent]] = []
+            self._onchange_handlers = []
         return self._onchange_handlers
 
     def onchange(self, handler: Handler[ChangeEvent]) -> Self:
@@ -167,6 +183,136 @@ class SupportsOnChange:
             session.call_handler(handler, event)
 
 
+class ToggleEvent:
+    """Event that fires when an element is opened or closed, such as a ``<details>`` element.
+
+    Args:
+        target: Element that was toggled.
+        open: Flag indicating whether the element is now open.
+    """
+
+    __slots__ = ("_target", "_open")
+
+    def __init__(self, target: Elem, open: bool) -> None:
+        self._target = target
+        self._open = open
+
+    @property
+    def target(self) -> Elem:
+        """Element that was toggled."""
+        return self._target
+
+    @property
+    def open(self) -> bool:
+        """Flag indicating whether the element is now open."""
+        return self._open
+
+
+class SupportsOnToggle:
+    """Mix-in class for `ontoggle` support."""
+
+    __slots__ = ()
+    _ontoggle_handlers: list[Handler[ToggleEvent]]
+
+    @property
+    def ontoggle_handlers(self) -> list[Handler[ToggleEvent]]:
+        if not hasattr(self, "_ontoggle_handlers"):
+            self._ontoggle_handlers = []
+        return self._ontoggle_handlers
+
+    def ontoggle(self, handler: Handler[ToggleEvent]) -> Self:
+        """Add event handler for toggle event.
+
+        Args:
+            handler: Function to be called when a toggle event is fired.
+        """
+        assert isinstance(self, Elem)
+        self.ontoggle_handlers.append(handler)
+        self.set_attr("ontoggle", True)
+        return self
+
+    def toggle(self, event: ToggleEvent) -> None:
+        """Trigger toggle event.
+
+        Args:
+            event: Toggle event instance to be passed to handlers.
+        """
+        assert isinstance(self, Elem)
+        session = Session.require()
+        for handler in self.ontoggle_handlers:
+            session.call_handler(handler, event)
+
+
+class ScrollEvent:
+    """Event that fires when an element is scrolled.
+
+    Args:
+        target: Element that was scrolled.
+        top: Number of pixels that the element is scrolled vertically.
+        height: Visible height of the element in pixels.
+    """
+
+    __slots__ = ("_target", "_top", "_height")
+
+    def __init__(self, target: Elem, top: float, height: float) -> None:
+        self._target = target
+        self._top = top
+        self._height = height
+
+    @property
+    def target(self) -> Elem:
+        """Element that was scrolled."""
+        return self._target
+
+    @property
+    def top(self) -> float:
+        """Number of pixels that the element is scrolled vertically."""
+        return self._top
+
+    @property
+    def height(self) -> float:
+        """Visible height of the element in pixels."""
+        return self._height
+
+
+class SupportsOnScroll:
+    """Mix-in class for `onscroll` support.
+
+    Scroll events are throttled by the client, so that at most one event is sent every 50 ms.
+    """
+
+    __slots__ = ()
+    _onscroll_handlers: list[Handler[ScrollEvent]]
+
+    @property
+    def onscroll_handlers(self) -> list[Handler[ScrollEvent]]:
+        if not hasattr(self, "_onscroll_handlers"):
+            self._onscroll_handlers = []
+        return self._onscroll_handlers
+
+    def onscroll(self, handler: Handler[ScrollEvent]) -> Self:
+        """Add event handler for scroll event.
+
+        Args:
+            handler: Function to be called when a scroll event is fired.
+        """
+        assert isinstance(self, Elem)
+        self.onscroll_handlers.append(handler)
+        self.set_attr("onscroll", True)
+        return self
+
+    def scroll(self, event: ScrollEvent) -> None:
+        """Trigger scroll event.
+
+        Args:
+            event: Scroll event instance to be passed to handlers.
+        """
+        assert isinstance(self, Elem)
+        session = Session.require()
+        for handler in self.onscroll_handlers:
+            session.call_handler(handler, event)
+
+
 # So that these events can be imported from `slash.events`
 __all__ = [
     name for name, obj in vars(sys.modules[__name__]).items() if isinstance(obj, type) and obj.__module__ == __name__
@@ -7,13 +7,16 @@ from typing import Literal, Self, cast
 
 from slash._message import Message
 from slash.core import Attr, Children, Elem, Session
-from slash.events import ChangeEvent, SupportsOnChange, SupportsOnClick, SupportsOnInput
+from slash.events import ChangeEvent, SupportsOnChange, SupportsOnClick, SupportsOnInput, SupportsOnToggle, ToggleEvent
 from slash.js import JSFunction
+from slash.layout import Lazy
 
 
 class Div(Elem, SupportsOnClick):
     """HTML ``<div>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("div", *children)
 
@@ -21,6 +24,8 @@ class Div(Elem, SupportsOnClick):
 class P(Elem, SupportsOnClick):
     """HTML ``<p>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("p", *children)
 
@@ -28,6 +33,8 @@ class P(Elem, SupportsOnClick):
 class Code(Elem, SupportsOnClick):
     """HTML ``<code>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("code", *children)
 
@@ -35,6 +42,8 @@ class Code(Elem, SupportsOnClick):
 class Br(Elem):
     """HTML ``<br>`` element."""
 
+    __slots__ = ()
+
     def __init__(self, *children: Children) -> None:
         super().__init__("br", *children)
 
@@ -42,6 +51,8 @@ class Br(Elem):
 class Span(Elem, SupportsOnClick):
     """HTML ``<span>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("span", *children)
 
@@ -49,6 +60,8 @@ class Span(Elem, SupportsOnClick):
 class Pre(Elem, SupportsOnClick):
     """HTML ``<pre>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("pre", *children)
 
@@ -56,6 +69,8 @@ class Pre(Elem, SupportsOnClick):
 class Ul(Elem, SupportsOnClick):
     """HTML ``<ul>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("ul", *children)
 
@@ -63,6 +78,8 @@ class Ul(Elem, SupportsOnClick):
 class Ol(Elem, SupportsOnClick):
     """HTML ``<ol>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("ol", *children)
 
@@ -70,20 +87,37 @@ class Ol(Elem, SupportsOnClick):
 class Li(Elem, SupportsOnClick):
     """HTML ``<li>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("li", *children)
 
 
-class Details(Elem, SupportsOnClick):
-    """HTML ``<details>`` element."""
+class Details(Elem, SupportsOnClick, SupportsOnToggle):
+    """HTML ``<details>`` element.
+
+    Children of type :py:class:`~slash.layout.Lazy` are revealed when the details are opened,
+    and concealed when the details are closed.
+    """
+
+    __slots__ = ("_onclick_handlers", "_ontoggle_handlers")
 
     def __init__(self, *children: Children) -> None:
         super().__init__("details", *children)
+        if any(isinstance(child, Lazy) for child in self.children):
+            self.ontoggle(self._handle_toggle)
+
+    def _handle_toggle(self, event: ToggleEvent) -> None:
+        for child in self.children:
+            if isinstance(child, Lazy):
+                child.reveal() if event.open else child.conceal()
 
 
 class Summary(Elem, SupportsOnClick):
     """HTML ``<summary>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("summary", *children)
 
@@ -91,6 +125,8 @@ class Summary(Elem, SupportsOnClick):
 class Label(Elem, SupportsOnClick):
     """HTML ``<label>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("label", *children)
 
@@ -98,6 +134,8 @@ class Label(Elem, SupportsOnClick):
 class Table(Elem, SupportsOnClick):
     """HTML ``<table>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("table", *children)
 
@@ -105,6 +143,8 @@ class Table(Elem, SupportsOnClick):
 class Tr(Elem, SupportsOnClick):
     """HTML ``<tr>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("tr", *children)
 
@@ -112,6 +152,8 @@ class Tr(Elem, SupportsOnClick):
 class Th(Elem, SupportsOnClick):
     """HTML ``<th>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("th", *children)
 
@@ -119,6 +161,8 @@ class Th(Elem, SupportsOnClick):
 class Td(Elem, SupportsOnClick):
     """HTML ``<td>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("td", *children)
 
@@ -126,6 +170,8 @@ class Td(Elem, SupportsOnClick):
 class H1(Elem, SupportsOnClick):
     """HTML ``<h1>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("h1", *children)
 
@@ -133,6 +179,8 @@ class H1(Elem, SupportsOnClick):
 class H2(Elem, SupportsOnClick):
     """HTML ``<h2>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("h2", *children)
 
@@ -140,6 +188,8 @@ class H2(Elem, SupportsOnClick):
 class H3(Elem, SupportsOnClick):
     """HTML ``<h3>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("h3", *children)
 
@@ -147,6 +197,8 @@ class H3(Elem, SupportsOnClick):
 class H4(Elem, SupportsOnClick):
     """HTML ``<h4>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("h4", *children)
 
@@ -154,6 +206,8 @@ class H4(Elem, SupportsOnClick):
 class H5(Elem, SupportsOnClick):
     """HTML ``<h5>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("h5", *children)
 
@@ -161,6 +215,8 @@ class H5(Elem, SupportsOnClick):
 class H6(Elem, SupportsOnClick):
     """HTML ``<h6>`` element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children) -> None:
         super().__init__("h6", *children)
 
@@ -175,6 +231,8 @@ class A(Elem, SupportsOnClick):
         target: Where to display the linked URL.
     """
 
+    __slots__ = ("_href", "_target", "_onclick_handlers")
+
     href = Attr("href")
     target = Attr("target")
 
@@ -200,6 +258,8 @@ class A(Elem, SupportsOnClick):
 class Button(Elem, SupportsOnClick):
     """HTML ``<button>`` element."""
 
+    __slots__ = ("_disabled", "_onclick_handlers")
+
     attr_disabled = Attr("disabled")
 
     def __init__(self, *children: Children, disabled: bool = False) -> None:
@@ -229,6 +289,16 @@ class Input(Elem, SupportsOnClick, SupportsOnInput, SupportsOnChange):
         placeholder: Placeholder text when input is empty.
     """
 
+    __slots__ = (
+        "_value",
+        "_type",
+        "_name",
+        "_placeholder",
+        "_onclick_handlers",
+        "_oninput_handlers",
+        "_onchange_handlers",
+    )
+
     type = Attr("type")
     name = Attr("name")
     value = Attr("value")
@@ -273,6 +343,8 @@ class Textarea(Elem, SupportsOnClick, SupportsOnInput, SupportsOnChange):
         placeholder: Placeholder text when textarea is empty.
     """
 
+    __slots__ = ("_value", "_placeholder", "_onclick_handlers", "_oninput_handlers", "_onchange_handlers")
+
     placeholder = Attr("placeholder")
 
     def __init__(
@@ -315,6 +387,8 @@ class Img(Elem):
         alt: Textual replacement for the image.
     """
 
+    __slots__ = ("_src", "_alt")
+
     src = Attr("src")
     alt = Attr("alt")
 
@@ -335,6 +409,8 @@ class Img(Elem):
 class Select(Elem, SupportsOnChange):
     """HTML ``<select>`` element."""
 
+    __slots__ = ("_value", "_onchange_handlers")
+
     def __init__(self, *options: Option | Sequence[Option]):
         super().__init__("select", *options)
         for option in options:
@@ -367,6 +443,8 @@ class Select(Elem, SupportsOnChange):
 class Option(Elem):
     """HTML ``<option>`` element."""
 
+    __slots__ = ("_value", "_disabled", "_hidden")
+
     value = Attr("value")
     attr_disabled = Attr("disabled")
     attr_hidden = Attr("hidden")
@@ -415,26 +493,40 @@ _JS_DIALOG_CLOSE = JSFunction(["id"], "document.getElementById(id).close()")
 
 
 class Dialog(Elem):
-    """HTML ``<dialog>`` element."""
+    """HTML ``<dialog>`` element.
+
+    Children of type :py:class:`~slash.layout.Lazy` are revealed when the dialog is shown,
+    and concealed when the dialog is closed using :py:meth:`close`.
+    """
+
+    __slots__ = ()
 
     def __init__(self, *children: Children):
         super().__init__("dialog", *children)
 
     def show(self) -> Self:
         """Show dialog modelessly using the ``HTMLDialogElement.show()`` JavaScript method."""
+        self._reveal_lazy(True)
         Session.require().execute(_JS_DIALOG_SHOW, [self.id])
         return self
 
     def show_modal(self) -> Self:
         """Show dialog as a modal using the ``HTMLDialogElement.showModal()`` JavaScript method."""
+        self._reveal_lazy(True)
         Session.require().execute(_JS_DIALOG_SHOW_MODAL, [self.id])
         return self
 
     def close(self) -> Self:
         """Close the dialog using the ``HTMLDialogElement.close()`` JavaScript method."""
         Session.require().execute(_JS_DIALOG_CLOSE, [self.id])
+        self._reveal_lazy(False)
         return self
 
+    def _reveal_lazy(self, reveal: bool) -> None:
+        for child in self.children:
+            if isinstance(child, Lazy) and child.revealed != reveal:
+                child.reveal() if reveal else child.conceal()
+
 
 class HTML(Elem):
     """HTML ``<div>`` element that contains arbitrary HTML.
@@ -443,13 +535,16 @@ class HTML(Elem):
         html: Arbitrary HTML content.
     """
 
+    __slots__ = ("_html",)
+
     def __init__(self, html: str) -> None:
         super().__init__("div")
         self.set_html(html)
         self.onmount(lambda _: self._update_html())
 
     def _update_html(self) -> None:
-        Session.require().send(Message.html(self.id, self._html))
+        if (session := self._session) is not None:
+            session.send(Message.html(self.id, self._html))
 
     @property
     def html(self) -> str:
@@ -461,6 +556,5 @@ class HTML(Elem):
 
     def set_html(self, html: str) -> Self:
         self._html = html
-        if self.is_mounted():
-            self._update_html()
+        self._update_html()
         return self
@@ -1,5 +1,9 @@
 """This module contains the Slash layout elements."""
 
+import asyncio
+from collections.abc import Callable
+from typing import Self
+
 from slash.core import Children, Elem
 from slash.events import SupportsOnClick
 
@@ -7,6 +11,8 @@ from slash.events import SupportsOnClick
 class Row(Elem, SupportsOnClick):
     """Row element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children):
         super().__init__(
             "div",
@@ -18,6 +24,8 @@ class Row(Elem, SupportsOnClick):
 class Column(Elem, SupportsOnClick):
     """Column element."""
 
+    __slots__ = ("_onclick_handlers",)
+
     def __init__(self, *children: Children):
         super().__init__(
             "div",
@@ -29,9 +37,77 @@ class Column(Elem, SupportsOnClick):
 class Panel(Elem):
     """Panel element."""
 
+    __slots__ = ()
+
     def __init__(self, *children: Children):
         super().__init__(
             "div",
             *children,
         )
         self.add_class("slash-panel")
+
+
+class Lazy(Elem):
+    """Element whose contents are only created and mounted when revealed.
+
+    The contents are hidden when concealed. :py:class:`~slash.html.Details` and
+    :py:class:`~slash.html.Dialog` reveal their `Lazy` children when opened, and
+    :py:class:`~slash.basic.Tabs` reveals the panel of the selected tab.
+
+    Args:
+        render: Function that creates the contents.
+        revealed: Flag indicating whether the contents are initially revealed.
+        unmount_after: If set, the contents are unmounted and discarded after being concealed
+            for this number of seconds. They are created again when revealed again.
+    """
+
+    __slots__ = ("_render", "_unmount_after", "_rendered", "_generation", "_revealed")
+
+    def __init__(
+        self,
+        render: Callable[[], Children],
+        *,
+        revealed: bool = False,
+        unmount_after: float | None = None,
+    ) -> None:
+        super().__init__("div")
+        self._render = render
+        self._unmount_after = unmount_after
+        self._rendered = False
+        self._generation = 0  # incremented on every reveal and conceal
+        self._revealed = revealed
+        if revealed:
+            self.reveal()
+        else:
+            self.style({"display": "none"})
+
+    @property
+    def revealed(self) -> bool:
+        return self._revealed
+
+    def reveal(self) -> Self:
+        """Create (if needed) and show the contents."""
+        self._revealed = True
+        self._generation += 1
+        if not self._rendered:
+            self._rendered = True
+            self.append(self._render())
+        self.style({"display": None})
+        return self
+
+    def conceal(self) -> Self:
+        """Hide the contents."""
+        self._revealed = False
+        self._generation += 1
+        self.style({"display": "none"})
+        if self._unmount_after is not None and self._rendered and self._session is not None:
+            self._session.create_task(self._discard(self._generation))
+        return self
+
+    async def _discard(self, generation: int) -> None:
+        """Discard the contents, unless revealed or concealed in the meantime."""
+        assert self._unmount_after is not None
+        await asyncio.sleep(self._unmount_after)
+        if self._generation == generation:
+            self._rendered = False
+            self.clear()
@@ -5,9 +5,12 @@ class Client {
         this.socket = null;
         this.functions = {};
         this.queue = [];
+        this.scrolling = new Set();
         this.onclick = this.onclick.bind(this);
         this.oninput = this.oninput.bind(this);
         this.onchange = this.onchange.bind(this);
+        this.ontoggle = this.ontoggle.bind(this);
+        this.onscroll = this.onscroll.bind(this);
         this.onpopstate = this.onpopstate.bind(this);
         window.addEventListener('popstate', this.onpopstate);
     }
@@ -197,11 +200,14 @@ class Client {
     }
     update(elem, message) {
         for (const attr in message) {
-            if (attr == 'event' || attr == 'id' || attr == 'tag' || attr == 'ns' || attr == 'position')
+            if (attr == 'event' || attr == 'id' || attr == 'tag' || attr == 'ns' || attr == 'position' || attr == 'before')
                 continue;
             if (attr == 'parent') {
                 const parent = this.getElementById(message.parent);
-                if ('position' in message) {
+                if ('before' in message) {
+                    parent.insertBefore(elem, this.getElementById(message.before));
+                }
+                else if ('position' in message) {
                     if (Object.values(parent.children).includes(elem))
                         parent.removeChild(elem);
                     const position = message.position;
@@ -217,6 +223,14 @@ class Client {
                 }
                 continue;
             }
+            if (attr == 'add_class') {
+                elem.classList.add(...message.add_class);
+                continue;
+            }
+            if (attr == 'remove_class') {
+                elem.classList.remove(...message.remove_class);
+                continue;
+            }
             if (attr == 'style') {
                 for (const [key, value] of Object.entries(message.style)) {
                     if (value !== null && typeof value !== 'string')
@@ -252,8 +266,26 @@ class Client {
                 }
                 continue;
             }
+            if (attr == 'ontoggle') {
+                if (message.ontoggle === true) {
+                    elem.addEventListener('toggle', this.ontoggle);
+                }
+                else {
+                    elem.removeEventListener('toggle', this.ontoggle);
+                }
+                continue;
+            }
+            if (attr == 'onscroll') {
+                if (message.onscroll === true) {
+                    elem.addEventListener('scroll', this.onscroll);
+                }
+                else {
+                    elem.removeEventListener('scroll', this.onscroll);
+                }
+                continue;
+            }
             if (attr == 'text') {
-                elem.innerText = message.text;
+                elem.textContent = message.text;
                 continue;
             }
             if (attr == 'value') {
@@ -299,10 +331,36 @@ class Client {
             });
         }
     }
+    ontoggle(event) {
+        const elem = event.currentTarget;
+        if (elem instanceof HTMLDetailsElement) {
+            this.send({
+                event: 'toggle',
+                id: elem.id,
+                open: elem.open
+            });
+        }
+    }
+    onscroll(event) {
+        const elem = event.currentTarget;
+        if (elem instanceof HTMLElement && !this.scrolling.has(elem)) {
+            this.scrolling.add(elem);
+            setTimeout(() => {
+                this.scrolling.delete(elem);
+                this.send({
+                    event: 'scroll',
+                    id: elem.id,
+                    top: elem.scrollTop,
+                    height: elem.clientHeight
+                });
+            }, 50);
+        }
+    }
     onpopstate(event) {
         this.send({
             event: 'popstate',
-            state: event.state
+            state: event.state,
+            url: window.location.href
         });
     }
     send(message) {
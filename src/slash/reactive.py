@@ -1,44 +1,359 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any, Generic, TypeVar
+import hashlib
+import heapq
+import itertools
+import operator
+import os
+import pickle
+import time
+from asyncio import Task
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Iterator, Mapping, Sequence
+from contextlib import ContextDecorator
+from dataclasses import dataclass, field
+from typing import Any, Generic, Literal, TypeAlias, TypeVar
+from weakref import WeakKeyDictionary
 
-from slash.core import Elem
+from slash.basic._keyed_list import KeyedList
+from slash.core import Elem, Session
 
 T = TypeVar("T")
+S = TypeVar("S")
+E = TypeVar("E", bound=Elem)
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+Source: TypeAlias = "Signal[Any] | Computed[Any] | SignalList[Any] | SignalDict[Any, Any]"
+
+# Strategy to decide whether a new value equals the previous value, in which case observers are not notified:
+# - "eq": values are compared using ``==``,
+# - "identity": values are compared using ``is``,
+# - "hash": digests of the contents of values are compared (see `_HashEquality`),
+# - "version": values are never considered equal, so that every update is a change,
+# - or a function that returns whether two values are equal.
+Equality: TypeAlias = Literal["eq", "identity", "hash", "version"] | Callable[[Any, Any], bool]
+
+_EQUALITIES: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "identity": operator.is_,
+    "version": lambda a, b: False,
+}
+
+
+def _equality(equals: Equality) -> Callable[[Any, Any], bool]:
+    if callable(equals):
+        return equals
+    if equals == "hash":
+        return _HashEquality()
+    if equals not in _EQUALITIES:
+        msg = f"Unknown equality strategy '{equals}'"
+        raise ValueError(msg)
+    return _EQUALITIES[equals]
+
+
+def _digest(value: Any) -> Hashable:
+    """Digest of the content of a value, for the "hash" equality strategy."""
+    if hasattr(value, "tobytes"):  # buffers such as numpy arrays
+        shape, dtype = getattr(value, "shape", None), str(getattr(value, "dtype", ""))
+        return type(value), shape, dtype, hashlib.blake2b(value.tobytes(), digest_size=16).digest()
+    try:
+        hash(value)
+    except TypeError:
+        pass
+    else:  # hashable values are their own digest, and are compared using `==`, as hashes may collide
+        return type(value), value
+    try:  # unhashable containers such as lists and dictionaries
+        return type(value), hashlib.blake2b(pickle.dumps(value), digest_size=16).digest()
+    except Exception as err:
+        msg = f"Cannot compute digest of value of type `{type(value).__name__}` for equality strategy 'hash'"
+        raise TypeError(msg) from err
+
+
+# Placeholder for the remembered value of a hash equality strategy, before any value is remembered
+_NO_VALUE = object()
+
+
+class _HashEquality:
+    """Equality strategy that compares digests of the contents of values.
+
+    The digest of the current value is remembered, so that every update computes only one digest,
+    and a value that was modified in place and set again is recognized as changed.
+    """
+
+    def __init__(self) -> None:
+        self._value: Any = _NO_VALUE
+        self._digest: Hashable = None
+
+    def remember(self, value: Any) -> None:
+        self._value, self._digest = value, _digest(value)
+
+    def __call__(self, a: Any, b: Any) -> bool:
+        digest = self._digest if self._value is a else _digest(a)
+        equal = digest == (new_digest := _digest(b))
+        self._value, self._digest = (a, digest) if equal else (b, new_digest)
+        return equal
 
 
 OBSERVER_STACK: list[Computed[Any] | Effect] = []
 
+# Observers that are scheduled to run, ordered by height and then by order of scheduling. The height
+# of an observer is larger than the heights of its dependencies, so running observers in order of
+# height runs every observer at most once, after all of its dependencies are up to date.
+PENDING: list[tuple[int, int, Computed[Any] | Effect]] = []
+_scheduled: set[Computed[Any] | Effect] = set()
+_counter = itertools.count()
+_batch_depth = 0
+
+# Observers created on the current page of each session. When the page is left, its effects are disposed,
+# and its computed values stop observing their dependencies unless they are still observed
+_OWNED: WeakKeyDictionary[Session, set[Computed[Any] | Effect]] = WeakKeyDictionary()
+
+# Deferred effects of each session, which run before the session sends its messages
+_DEFERRED: WeakKeyDictionary[Session, dict[Effect, None]] = WeakKeyDictionary()
+
+# Profiler that records the runs of observers, if profiling is enabled
+PROFILER: Profiler | None = None
 
-def get(x: Signal[T] | Computed[T]) -> T:
+
+def get(x: Signal[T] | Computed[T] | SignalList[T] | SignalDict[Any, T]) -> Any:
+    if isinstance(x, Computed) and x._dirty:
+        run(x)
     if OBSERVER_STACK:
         observer = OBSERVER_STACK[-1]
         x._observers.add(observer)
         observer._dependencies.add(x)
+        if observer._height <= x._height:
+            _raise_height(observer, x._height + 1)
     return x._value
 
 
+def _raise_height(x: Computed[Any] | Effect, height: int) -> None:
+    """Raise the height of an observer, and of its observers in turn where needed."""
+    stack: list[tuple[Computed[Any] | Effect, int]] = [(x, height)]
+    while stack:
+        x, height = stack.pop()
+        if x._height < height:
+            x._height = height
+            if isinstance(x, Computed):
+                stack.extend((observer, height + 1) for observer in x._observers)
+
+
 def run(x: Computed[T] | Effect) -> None:
-    for dep in x._dependencies:
-        dep._observers.discard(x)
-    x._dependencies.clear()
+    _unsubscribe(x)
     OBSERVER_STACK.append(x)
+    start = time.perf_counter() if PROFILER is not None else None
     try:
         value = x._fn()
     finally:
         OBSERVER_STACK.pop()
+        if start is not None and PROFILER is not None:
+            PROFILER._record(x, time.perf_counter() - start)
+        if x._disposed:  # a disposed observer may still compute, but does not observe
+            _unsubscribe(x)
 
     if isinstance(x, Computed):
-        if not hasattr(x, "_value") or value != x._value:
+        x._dirty = False
+        if not hasattr(x, "_value") or not x._equals(x._value, value):
             x._value = value
-            for observer in x._observers:
-                run(observer)
+            x._version += 1
+            notify(x._observers, x)
+
+
+def _unsubscribe(x: Computed[Any] | Effect) -> None:
+    """Stop observing all dependencies."""
+    for dep in x._dependencies:
+        dep._observers.discard(x)
+    x._dependencies.clear()
+
+
+def _own(x: Computed[Any] | Effect) -> None:
+    """Register observer with the current session, if any, to release it when the page is left."""
+    if (session := Session.current()) is None:
+        return
+    if (owned := _OWNED.get(session)) is None:
+        owned = _OWNED[session] = set()
+
+        def leave() -> None:
+            _OWNED.pop(session, None)
+            for x in owned:
+                if isinstance(x, Effect):
+                    x.dispose()
+            # Computed values may be shared with other sessions, so they are not disposed but marked as
+            # outdated, and computed again when read. Higher computed values go first, so that they
+            # release the values they depend on.
+            for x in sorted(owned, key=lambda x: x._height, reverse=True):
+                x._session = None
+                if isinstance(x, Computed) and not x._disposed and not x._observers:
+                    x._invalidate()
+
+        session.onleave(leave)
+    owned.add(x)
+    x._session = session
+
+
+def _disown(x: Computed[Any] | Effect) -> None:
+    """Unregister observer from its session."""
+    if x._session is not None and (owned := _OWNED.get(x._session)) is not None:
+        owned.discard(x)
+    x._session = None
+
+
+def _defer(effect: Effect) -> None:
+    """Schedule effect to run once before its session sends its messages."""
+    assert effect._session is not None
+    if (deferred := _DEFERRED.get(effect._session)) is None:
+        deferred = _DEFERRED[effect._session] = {}
+
+        def run_deferred() -> None:
+            while deferred:
+                effect = next(iter(deferred))
+                del deferred[effect]
+                if not effect._disposed:
+                    with batch():  # observers scheduled by the effect also run before sending
+                        run(effect)
+
+        effect._session.onflush(run_deferred)
+    deferred[effect] = None
+
+
+def notify(observers: set[Computed[Any] | Effect], source: Source | None = None) -> None:
+    """Schedule observers to run, and run them unless a batch is in progress.
+
+    Args:
+        observers: Observers to schedule.
+        source: Reactive value that changed, which is recorded as the trigger of the observers when profiling.
+    """
+    if PROFILER is not None and source is not None:
+        PROFILER._trigger(observers, source)
+    for observer in observers:
+        if observer not in _scheduled:
+            _scheduled.add(observer)
+            heapq.heappush(PENDING, (observer._height, next(_counter), observer))
+    if not _batch_depth:
+        with batch():
+            pass  # scheduled observers run when the batch ends
+
+
+class batch(ContextDecorator):
+    """Context manager and decorator that defers running observers until the end of the batch.
+
+    Observers affected by multiple updates within the batch run only once.
+
+        >>> with batch():
+        >>>     first_name.set("John")
+        >>>     last_name.set("Doe")
+    """
+
+    def __enter__(self) -> batch:
+        global _batch_depth
+        _batch_depth += 1
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        global _batch_depth
+        error: Exception | None = None
+        try:
+            # The outermost batch runs scheduled observers, and the observers they schedule in turn.
+            # If an observer raises, the other observers still run, and the first error is raised afterwards
+            while _batch_depth == 1 and PENDING:
+                height, _, observer = heapq.heappop(PENDING)
+                if observer._height > height:  # height was raised after scheduling
+                    heapq.heappush(PENDING, (observer._height, next(_counter), observer))
+                    continue
+                _scheduled.discard(observer)
+                if observer._disposed:
+                    continue
+                if isinstance(observer, Effect) and observer._defer and observer._session is not None:
+                    _defer(observer)
+                elif isinstance(observer, Computed) and observer._lazy and not observer._observers:
+                    observer._invalidate()  # nothing depends on it, so recompute only when read
+                else:
+                    try:
+                        run(observer)
+                    except Exception as err:
+                        error = error or err
+        finally:
+            if _batch_depth == 1 and PENDING:  # interrupted, so drop the scheduled observers
+                PENDING.clear()
+                _scheduled.clear()
+            _batch_depth -= 1
+        if error is not None:
+            raise error
 
 
 def to_elem(x: Signal[T] | Computed[T], tag: str = "span") -> Elem:
-    elem = Elem(tag)
-    Effect(lambda: elem.set_text(str(x())))
+    return bind_text(Elem(tag), x)
+
+
+def bind_text(elem: E, x: Signal[T] | Computed[T], format: Callable[[T], str] = str) -> E:
+    """Bind the text content of an element to a reactive value.
+
+    Every change of the value is sent as a single update, and only if the text changed.
+
+    Args:
+        elem: Element whose text content to bind.
+        x: Reactive value.
+        format: Function that converts the value to text.
+
+    Returns:
+        The given element.
+    """
+    Effect(lambda: elem.set_text(format(x())), owner=elem)
+    return elem
+
+
+def bind_attr(elem: E, name: str, x: Signal[Any] | Computed[Any]) -> E:
+    """Bind an attribute of an element to a reactive value.
+
+    The attribute is removed while the value is `None`, and otherwise set to the value.
+
+    Args:
+        elem: Element whose attribute to bind.
+        name: Name of the attribute.
+        x: Reactive value.
+
+    Returns:
+        The given element.
+    """
+
+    def update() -> None:
+        value = x()
+        if value is None:
+            elem.remove_attr(name)
+        else:
+            elem.set_attr(name, value)
+
+    Effect(update, owner=elem)
+    return elem
+
+
+def bind_style(elem: E, property: str, x: Signal[str | None] | Computed[str | None]) -> E:
+    """Bind a CSS property of an element to a reactive value.
+
+    Args:
+        elem: Element whose CSS property to bind.
+        property: Name of the CSS property.
+        x: Reactive value. If the value is `None`, the CSS property is reset.
+
+    Returns:
+        The given element.
+    """
+    Effect(lambda: elem.style({property: x()}), owner=elem)
+    return elem
+
+
+def bind_class(elem: E, name: str, x: Signal[Any] | Computed[Any]) -> E:
+    """Bind the presence of a class on an element to a reactive value.
+
+    Args:
+        elem: Element whose class to bind.
+        name: Name of the class.
+        x: Reactive value. The class is present while the value is truthy.
+
+    Returns:
+        The given element.
+    """
+    Effect(lambda: elem.add_class(name) if x() else elem.remove_class(name), owner=elem)
     return elem
 
 
@@ -47,11 +362,29 @@ class Signal(Generic[T]):
 
     Args:
         value: Initial value.
+        equals: Strategy to decide whether a new value equals the current value, in which case
+            observers are not notified. Either ``"eq"`` (compare using ``==``), ``"identity"``
+            (compare using ``is``), ``"hash"`` (compare digests of the contents), ``"version"``
+            (every update is a change), or a function that returns whether two values are equal.
+            Large values such as arrays are best compared by identity, version or hash. With
+            ``"hash"``, values must be hashable, expose their contents through ``tobytes()`` like
+            numpy arrays, or be picklable like lists and dictionaries. Hashable values are compared
+            using ``==``. Other values whose digests are equal are considered equal.
     """
 
-    def __init__(self, value: T) -> None:
+    def __init__(self, value: T, *, equals: Equality = "eq") -> None:
         self._value = value
         self._observers: set[Computed[Any] | Effect] = set()
+        self._height = 0
+        self._equals = _equality(equals)
+        if isinstance(self._equals, _HashEquality):
+            self._equals.remember(value)  # raises early if the value cannot be digested
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Number of times that the value has changed."""
+        return self._version
 
     def set(self, value: T) -> None:
         """Set the value and notify all observers if it has changed.
@@ -59,8 +392,9 @@ class Signal(Generic[T]):
         Args:
             value: New value to set.
         """
-        if value != self._value:
+        if not self._equals(self._value, value):
             self._value = value
+            self._version += 1
             self.trigger()
 
     def get(self) -> T:
@@ -69,8 +403,7 @@ class Signal(Generic[T]):
 
     def trigger(self) -> None:
         """Trigger all observers without changing the value."""
-        for observer in self._observers:
-            run(observer)
+        notify(self._observers, self)
 
     def __call__(self) -> T:
         return self.get()
@@ -95,17 +428,52 @@ class Signal(Generic[T]):
 class Computed(Generic[T]):
     """Reactive value computed from other reactive values.
 
+    When the client navigates to another page or disconnects, a computed value that was created
+    within the session stops observing its dependencies, unless effects or computed values of other
+    sessions still depend on it. It is then computed again when it is read.
+
     Args:
         fn: Function that computes the value from other reactive values.
+        lazy: Flag indicating whether the value is computed lazily. A lazy value is not computed
+            when created, and when the values it depends on are updated while no effect or other
+            computed value depends on it, it is only marked as outdated. It is then computed
+            when it is read.
+        equals: Strategy to decide whether a newly computed value equals the current value, in
+            which case observers are not notified. See :py:class:`Signal`.
     """
 
     _value: T
 
-    def __init__(self, fn: Callable[[], T]) -> None:
+    def __init__(self, fn: Callable[[], T], *, lazy: bool = False, equals: Equality = "eq") -> None:
         self._fn = fn
-        self._dependencies: set[Signal[Any] | Computed[Any]] = set()
+        self._dependencies: set[Source] = set()
         self._observers: set[Computed[Any] | Effect] = set()
-        run(self)
+        self._height = 1
+        self._equals = _equality(equals)
+        self._version = 0
+        self._lazy = lazy
+        self._dirty = True
+        self._disposed = False
+        self._session: Session | None = None
+        _own(self)
+        if not lazy:
+            run(self)
+
+    @property
+    def version(self) -> int:
+        """Number of times that the value was computed and differed from the previous value."""
+        return self._version
+
+    def _invalidate(self) -> None:
+        """Mark the value as outdated, and stop observing its dependencies until it is read again."""
+        self._dirty = True
+        _unsubscribe(self)
+
+    def dispose(self) -> None:
+        """Stop updating the value. The value remains the last computed value."""
+        self._disposed = True
+        _unsubscribe(self)
+        _disown(self)
 
     def get(self) -> T:
         """Return the current value."""
@@ -115,6 +483,8 @@ class Computed(Generic[T]):
         return self.get()
 
     def __repr__(self) -> str:
+        if self._dirty:
+            run(self)
         return f"Computed({self._value})"
 
     def to_elem(self, tag: str = "span") -> Elem:
@@ -134,14 +504,578 @@ class Computed(Generic[T]):
 class Effect:
     """Reactive effect that runs automatically when the reactive values that it depends are updated.
 
+    An effect that is created within a session is disposed when the client navigates to another
+    page or disconnects.
+
     Args:
         fn: Function that executes the effect from reactive values.
+        owner: Element that owns the effect. The effect is disposed when the element is unmounted,
+            and runs again when the element is mounted again.
+        defer: Flag indicating whether the effect is deferred. A deferred effect that is created within
+            a session does not run immediately when the reactive values that it depends on are updated,
+            but runs once right before the session sends its messages to the client.
     """
 
-    def __init__(self, fn: Callable[[], Any]) -> None:
+    def __init__(self, fn: Callable[[], Any], *, owner: Elem | None = None, defer: bool = False) -> None:
         self._fn = fn
-        self._dependencies: set[Signal[Any] | Computed[Any]] = set()
+        self._dependencies: set[Source] = set()
+        self._height = 1
+        self._defer = defer
+        self._disposed = False
+        self._session: Session | None = None
+        _own(self)
+        if owner is not None:
+            owner.onunmount(self.dispose)
+            owner.onmount(self._resume)
         run(self)
 
+    def dispose(self) -> None:
+        """Stop running the effect."""
+        self._disposed = True
+        _unsubscribe(self)
+        _disown(self)
+
+    def _resume(self) -> None:
+        """Run the effect again after it was disposed."""
+        if self._disposed:
+            self._disposed = False
+            _own(self)
+            run(self)
+
+
+class Resource(Generic[S, T]):
+    """Reactive value that is fetched asynchronously, such as the result of a query.
+
+    The fetcher is called with the result of `source`, and is called again whenever the reactive
+    values that `source` depends on are updated. A fetch that is still in progress is then
+    cancelled, and the result of an outdated fetch is never applied. Must be created within a session.
+
+        >>> query = Signal("")
+        >>> results = Resource(query, search)  # where `search` is an async function of the query
+        >>> bind_class(results.value.to_elem(), "loading", results.loading)
+
+    Args:
+        source: Function that computes the input of the fetcher from reactive values.
+        fetcher: Async function that fetches the value for an input.
+        initial: Value until the first fetch completes.
+    """
+
+    def __init__(
+        self,
+        source: Callable[[], S],
+        fetcher: Callable[[S], Awaitable[T]],
+        *,
+        initial: T | None = None,
+    ) -> None:
+        self._session = Session.require()
+        self._fetcher = fetcher
+        self._task: Task | None = None
+        self._version = 0  # incremented for every fetch, to recognize outdated fetches
+        self._value: Signal[T | None] = Signal(initial)
+        self._loading = Signal(False)
+        self._error: Signal[Exception | None] = Signal(None)
+        self._effect = Effect(lambda: self._fetch(source()))
+
+    @property
+    def value(self) -> Signal[T | None]:
+        """Signal holding the result of the latest completed fetch."""
+        return self._value
+
+    @property
+    def loading(self) -> Signal[bool]:
+        """Signal holding whether a fetch is in progress."""
+        return self._loading
+
+    @property
+    def error(self) -> Signal[Exception | None]:
+        """Signal holding the exception raised by the latest fetch, or `None` if it succeeded."""
+        return self._error
+
+    def get(self) -> T | None:
+        """Return the result of the latest completed fetch."""
+        return self._value.get()
+
+    def __call__(self) -> T | None:
+        return self.get()
+
+    def refetch(self) -> None:
+        """Fetch again for the current input."""
+        run(self._effect)
+
+    def dispose(self) -> None:
+        """Stop fetching, and cancel the fetch in progress."""
+        self._effect.dispose()
+        if self._task is not None:
+            self._task.cancel()
+
+    def _fetch(self, input: S) -> None:
+        self._version += 1
+        version = self._version
+        if self._task is not None:
+            self._task.cancel()
+        self._loading.set(True)
+
+        async def fetch() -> None:
+            try:
+                value = await self._fetcher(input)
+            except Exception as err:
+                if version == self._version:
+                    with batch():
+                        self._error.set(err)
+                        self._loading.set(False)
+                return
+            if version == self._version:
+                with batch():
+                    self._value.set(value)
+                    self._error.set(None)
+                    self._loading.set(False)
+
+        self._task = self._session.create_task(fetch())
+
+
+@dataclass(frozen=True)
+class ListChange(Generic[T]):
+    """Change of a :py:class:`SignalList`, in which `removed` items starting at `index` were
+    replaced by the `inserted` items."""
+
+    index: int
+    removed: int
+    inserted: Sequence[T]
+
+
+@dataclass(frozen=True)
+class DictChange(Generic[K, V]):
+    """Change of a :py:class:`SignalDict`, in which the item with key `key` was set to `value`,
+    or was deleted."""
+
+    key: K
+    value: V | None
+    deleted: bool = False
+
+
+class SignalList(Generic[T]):
+    """Reactive list that notifies observers when updated.
+
+    Besides notifying observers, every update emits a :py:class:`ListChange` that describes
+    the update, so that listeners can process only the changed items.
+
+    Args:
+        items: Initial items.
+    """
+
+    def __init__(self, items: Iterable[T] = ()) -> None:
+        self._value: list[T] = list(items)
+        self._observers: set[Computed[Any] | Effect] = set()
+        self._height = 0
+        self._listeners: list[Callable[[ListChange[T]], Any]] = []
+
+    def get(self) -> Sequence[T]:
+        """Return the current items."""
+        return get(self)
+
+    def __call__(self) -> Sequence[T]:
+        return self.get()
+
+    def __len__(self) -> int:
+        return len(self.get())
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.get())
+
+    def __getitem__(self, index: int) -> T:
+        return self.get()[index]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        self.splice(range(len(self._value))[index], 1, [item])
+
+    def __delitem__(self, index: int) -> None:
+        self.splice(range(len(self._value))[index], 1)
+
+    def __repr__(self) -> str:
+        return f"SignalList({self._value})"
+
+    def onchange(self, listener: Callable[[ListChange[T]], Any]) -> Callable[[], None]:
+        """Add listener that is called with every change of the list.
+
+        Args:
+            listener: Function to be called with a change.
+
+        Returns:
+            Function that removes the listener.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def splice(self, index: int, count: int, items: Iterable[T] = ()) -> None:
+        """Replace a range of items.
+
+        Args:
+            index: Index of the first item to replace.
+            count: Number of items to replace.
+            items: Items to insert at the given index.
+        """
+        index, _, _ = slice(index, None).indices(len(self._value))
+        count = min(count, len(self._value) - index)
+        items = list(items)
+        if not count and not items:
+            return
+        self._value[index : index + count] = items
+        change = ListChange(index, count, items)
+        for listener in list(self._listeners):
+            listener(change)
+        notify(self._observers, self)
+
+    def set(self, items: Iterable[T]) -> None:
+        """Replace all items. Unlike :py:meth:`Signal.set`, the items are not compared.
+
+        Args:
+            items: New items.
+        """
+        self.splice(0, len(self._value), items)
+
+    def append(self, item: T) -> None:
+        self.splice(len(self._value), 0, [item])
+
+    def extend(self, items: Iterable[T]) -> None:
+        self.splice(len(self._value), 0, items)
+
+    def insert(self, index: int, item: T) -> None:
+        self.splice(index, 0, [item])
+
+    def pop(self, index: int = -1) -> T:
+        index = range(len(self._value))[index]
+        item = self._value[index]
+        self.splice(index, 1)
+        return item
+
+    def remove(self, item: T) -> None:
+        self.splice(self._value.index(item), 1)
+
+    def clear(self) -> None:
+        self.splice(0, len(self._value))
+
+    def to_keyed_list(
+        self,
+        render: Callable[[T], Elem],
+        *,
+        key: Callable[[T], Hashable],
+        tag: str = "div",
+    ) -> KeyedList[T]:
+        """Create an element whose children are rendered from the items of the list.
+
+        Every change of the list only creates or removes the children of the changed items.
+
+        Args:
+            render: Function that creates the element for an item.
+            key: Function that returns the key of an item. Keys must be hashable and unique.
+            tag: HTML tag of the element.
+
+        Returns:
+            Keyed list element whose children follow the items of the list.
+        """
+        elem = KeyedList(self._value, key=key, render=render, tag=tag)
+
+        def apply(change: ListChange[T]) -> None:
+            elem.splice_items(change.index, change.removed, change.inserted)
+
+        _follow(elem, self, apply, lambda: elem.set_items(self._value))
+        return elem
+
+
+class SignalDict(Generic[K, V]):
+    """Reactive dictionary that notifies observers when updated.
+
+    Besides notifying observers, every update emits a :py:class:`DictChange` that describes
+    the update, so that listeners can process only the changed items.
+
+    Args:
+        items: Initial items.
+    """
+
+    def __init__(self, items: Mapping[K, V] | None = None) -> None:
+        self._value: dict[K, V] = dict(items or {})
+        self._observers: set[Computed[Any] | Effect] = set()
+        self._height = 0
+        self._listeners: list[Callable[[DictChange[K, V]], Any]] = []
+
+    def get(self) -> Mapping[K, V]:
+        """Return the current items."""
+        return get(self)
+
+    def __call__(self) -> Mapping[K, V]:
+        return self.get()
+
+    def __len__(self) -> int:
+        return len(self.get())
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.get())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.get()
+
+    def __getitem__(self, key: K) -> V:
+        return self.get()[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if key in self._value and self._value[key] == value:
+            return
+        self._value[key] = value
+        self._emit(DictChange(key, value))
+
+    def __delitem__(self, key: K) -> None:
+        del self._value[key]
+        self._emit(DictChange(key, None, deleted=True))
+
+    def __repr__(self) -> str:
+        return f"SignalDict({self._value})"
+
+    def _emit(self, change: DictChange[K, V]) -> None:
+        for listener in list(self._listeners):
+            listener(change)
+        notify(self._observers, self)
+
+    def onchange(self, listener: Callable[[DictChange[K, V]], Any]) -> Callable[[], None]:
+        """Add listener that is called with every change of the dictionary.
+
+        Args:
+            listener: Function to be called with a change.
+
+        Returns:
+            Function that removes the listener.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def pop(self, key: K) -> V:
+        value = self._value[key]
+        del self[key]
+        return value
+
+    def update(self, items: Mapping[K, V]) -> None:
+        with batch():
+            for key, value in items.items():
+                self[key] = value
+
+    def set(self, items: Mapping[K, V]) -> None:
+        """Replace all items, emitting changes only for the items that are deleted, added or changed.
+
+        Args:
+            items: New items.
+        """
+        with batch():
+            for key in [key for key in self._value if key not in items]:
+                del self[key]
+            self.update(items)
+
+    def clear(self) -> None:
+        self.set({})
+
+    def to_keyed_list(self, render: Callable[[K, V], Elem], *, tag: str = "div") -> KeyedList[tuple[K, V]]:
+        """Create an element whose children are rendered from the items of the dictionary.
+
+        Every change of the dictionary only creates or removes the child of the changed item.
+
+        Args:
+            render: Function that creates the element for an item from its key and value.
+            tag: HTML tag of the element.
+
+        Returns:
+            Keyed list element whose children follow the items of the dictionary.
+        """
+        elem = KeyedList(self._value.items(), key=lambda item: item[0], render=lambda item: render(*item), tag=tag)
+
+        def apply(change: DictChange[K, V]) -> None:
+            if change.deleted:
+                elem.remove_item(change.key)
+            else:
+                elem.set_item((change.key, change.value))  # ty: ignore[invalid-argument-type]
+
+        _follow(elem, self, apply, lambda: elem.set_items(self._value.items()))
+        return elem
+
+
+def _follow(
+    elem: Elem,
+    source: SignalList[Any] | SignalDict[Any, Any],
+    listener: Callable[[Any], Any],
+    sync: Callable[[], Any],
+) -> None:
+    """Apply the changes of a reactive collection to an element, until it is unmounted or the page
+    is left. When mounted again, the element is synchronized and follows the changes again."""
+    unsubscribe: Callable[[], None] | None = source.onchange(listener)
+
+    def stop() -> None:
+        nonlocal unsubscribe
+        if unsubscribe is not None:
+            unsubscribe()
+            unsubscribe = None
+
+    def start() -> None:
+        nonlocal unsubscribe
+        if unsubscribe is None:
+            sync()
+            unsubscribe = source.onchange(listener)
+
+    elem.onunmount(stop)
+    elem.onmount(start)
+    if (session := Session.current()) is not None:
+        session.onleave(stop)
+
+
+@dataclass
+class NodeStats:
+    """Statistics of a computed value or effect, or of all computed values or effects created
+    by the same function, recorded by the :py:class:`Profiler`.
+
+    Attributes:
+        label: Kind of observer, and name and location of its function.
+        runs: Number of times that the function ran.
+        time: Cumulative time in seconds spent running the function, including the time spent
+            computing other values that it reads.
+        last_trigger: Name of the reactive value whose change last scheduled the observer.
+        nodes: Number of observers, if the statistics are combined for a function.
+    """
+
+    label: str
+    runs: int = 0
+    time: float = 0.0
+    last_trigger: str | None = None
+    nodes: int = field(default=1, repr=False)
+
+
+class Profiler:
+    """Profiler of the reactive graph, which records how often and how long computed values and
+    effects run, and which change triggered them.
+
+    Use :py:func:`enable_profiler` to start profiling. The profiler is enabled by ``App(debug=True)``.
+    """
+
+    def __init__(self) -> None:
+        self._nodes: WeakKeyDictionary[Computed[Any] | Effect, NodeStats] = WeakKeyDictionary()
+        self._functions: dict[str, NodeStats] = {}
+
+    def stats(self, x: Computed[Any] | Effect) -> NodeStats | None:
+        """Get the statistics of a computed value or effect.
+
+        Args:
+            x: Computed value or effect.
+
+        Returns:
+            Statistics of the observer, or `None` if it did not run since profiling started.
+        """
+        return self._nodes.get(x)
+
+    def functions(self) -> list[NodeStats]:
+        """Get the statistics of all observers combined per function, sorted by cumulative time.
+
+        Statistics of observers that no longer exist are included.
+        """
+        return sorted(self._functions.values(), key=lambda stats: stats.time, reverse=True)
+
+    def reset(self) -> None:
+        """Forget all recorded statistics."""
+        self._nodes.clear()
+        self._functions.clear()
+
+    def report(self, limit: int = 20) -> str:
+        """Format the functions that took the most time as a table.
+
+        Args:
+            limit: Maximum number of functions to include.
+        """
+        lines = [f"{'time (ms)':>10} {'runs':>7} {'nodes':>6}  function (last trigger)"]
+        for stats in self.functions()[:limit]:
+            trigger = f" ({stats.last_trigger})" if stats.last_trigger is not None else ""
+            lines.append(f"{stats.time * 1000:>10.2f} {stats.runs:>7} {stats.nodes:>6}  {stats.label}{trigger}")
+        return "\n".join(lines)
+
+    def graph(self) -> str:
+        """Format the current dependency graph of all observers that ran since profiling started.
+
+        Every observer is listed with the reactive values it depends on, in order of height, followed
+        by the signals and reactive collections that are observed, with their number of observers.
+        """
+        nodes = sorted(self._nodes.items(), key=lambda item: item[0]._height)
+        sources: dict[int, Source] = {}
+        lines: list[str] = []
+        for x, stats in nodes:
+            deps = sorted(_name(dep) for dep in x._dependencies)
+            lines.append(f"{_name(x)} {stats.label} <- {', '.join(deps) or '(none)'}")
+            sources.update((id(dep), dep) for dep in x._dependencies if not isinstance(dep, Computed))
+        for source in sources.values():
+            lines.append(f"{_name(source)} {source!r:.60} -> {len(source._observers)} observers")
+        return "\n".join(lines)
+
+    def _record(self, x: Computed[Any] | Effect, elapsed: float) -> None:
+        if (stats := self._nodes.get(x)) is None:
+            stats = self._nodes[x] = NodeStats(_label(x))
+            if (total := self._functions.get(stats.label)) is None:
+                self._functions[stats.label] = NodeStats(stats.label)
+            else:
+                total.nodes += 1
+        total = self._functions[stats.label]
+        stats.runs += 1
+        stats.time += elapsed
+        total.runs += 1
+        total.time += elapsed
+        total.last_trigger = stats.last_trigger
+
+    def _trigger(self, observers: set[Computed[Any] | Effect], source: Source) -> None:
+        name = _name(source)
+        for observer in observers:
+            if (stats := self._nodes.get(observer)) is not None:
+                stats.last_trigger = name
+
+
+def _name(x: Source | Effect) -> str:
+    """Name that identifies a reactive value or effect."""
+    return f"{type(x).__name__}@{id(x):x}"
+
+
+def _label(x: Computed[Any] | Effect) -> str:
+    """Kind of observer, and name and location of its function."""
+    fn = x._fn
+    label = f"{type(x).__name__} {getattr(fn, '__qualname__', repr(fn))}"
+    if (code := getattr(fn, "__code__", None)) is not None:
+        label += f" ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return label
+
+
+def enable_profiler() -> Profiler:
+    """Start profiling the reactive graph, if not started yet.
+
+    Returns:
+        Profiler that records the runs of computed values and effects.
+    """
+    global PROFILER
+    if PROFILER is None:
+        PROFILER = Profiler()
+    return PROFILER
+
+
+def disable_profiler() -> None:
+    """Stop profiling the reactive graph."""
+    global PROFILER
+    PROFILER = None
+
 
-__all__ = ["Signal", "Computed", "Effect"]
+__all__ = [
+    "Signal",
+    "Computed",
+    "Effect",
+    "Resource",
+    "batch",
+    "SignalList",
+    "SignalDict",
+    "ListChange",
+    "DictChange",
+    "Profiler",
+    "NodeStats",
+    "enable_profiler",
+    "disable_profiler",
+    "bind_text",
+    "bind_attr",
+    "bind_style",
+    "bind_class",
+]
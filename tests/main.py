@@ -4,6 +4,7 @@ from collections.abc import Callable
 
 from tests.axes import test_axes
 from tests.colors import test_colors
+from tests.component import test_component
 from tests.confirm import test_confirm
 from tests.data_table import test_data
 from tests.details import test_details
@@ -18,6 +19,7 @@ from tests.icons import test_icons
 from tests.image import test_image
 from tests.input import test_input
 from tests.js import test_js
+from tests.keyed_list import test_keyed_list
 from tests.latex import test_latex
 from tests.loading import test_loading
 from tests.log import test_log
@@ -31,6 +33,7 @@ from tests.svg import test_svg
 from tests.tabs import test_tabs
 from tests.tooltip import test_tooltip
 from tests.upload import test_upload
+from tests.virtual_list import test_virtual_list
 
 from slash import App
 from slash.core import Elem, Session
@@ -41,6 +44,7 @@ TESTS: dict[str, Callable[[], Elem]] = dict(
     sorted(
         {
             "colors": test_colors,
+            "component": test_component,
             "session": test_session,
             "data": test_data,
             "form": test_form,
@@ -69,6 +73,8 @@ TESTS: dict[str, Callable[[], Elem]] = dict(
             "tooltip": test_tooltip,
             "reactive": test_reactive,
             "icons": test_icons,
+            "keyed_list": test_keyed_list,
+            "virtual_list": test_virtual_list,
         }.items()
     )
 )
@@ -96,10 +102,10 @@ def wrap_test(test: str, method: Callable[[], Elem]) -> Callable[[], Elem]:
             H2(f"Slash test - {test}").style({"text-align": "center"}),
             Row(
                 Button("Previous test", disabled=prev_test is None).onclick(
-                    lambda: Session.require().set_location(f"/test/{prev_test}")
+                    lambda: Session.require().navigate(f"/test/{prev_test}")
                 ),
                 Button("Next test", disabled=next_test is None).onclick(
-                    lambda: Session.require().set_location(f"/test/{next_test}")
+                    lambda: Session.require().navigate(f"/test/{next_test}")
                 ),
             ).style({"gap": "16px", "justify-content": "center"}),
             method(),
@@ -110,7 +116,7 @@ def wrap_test(test: str, method: Callable[[], Elem]) -> Callable[[], Elem]:
 
 if __name__ == "__main__":
     app = App()
-    app.add_route("/", home)
+    app.add_route("/", home, cache=True)
     for test, method in TESTS.items():
         app.add_route(f"/test/{test}", wrap_test(test, method))
     app.run()
@@ -0,0 +1,55 @@
+from collections.abc import Callable
+
+from slash.component import Component
+from slash.core import Elem
+from slash.html import Button, Code, Div, Li, P, Span, Ul
+from slash.layout import Column, Row
+
+
+def todo_list(props: tuple[str, ...]) -> Elem:
+    return Column(
+        Span(f"There are {len(props)} items").style({"font-weight": "bold" if props else "normal"}),
+        Ul([Li(item) for item in props]) if props else Span("Nothing to do!"),
+    )
+
+
+def status(highlight: bool) -> Elem:
+    return P("Status: ", Code("ready") if highlight else Span("ready"), " (text around the status stays in place)")
+
+
+def scoreboard(title: Elem) -> Callable[[int], Elem]:
+    def render(score: int) -> Elem:
+        if score % 2 == 0:
+            return Div(title, Span(f": {score} (even)"))
+        return P(Span(f"{score} (odd) for "), title)
+
+    return render
+
+
+def test_component() -> Elem:
+    items = ["Feed the cat", "Water the plants", "Buy groceries", "Call grandma"]
+
+    return Div(
+        P(
+            "This page tests the ",
+            Code("Component"),
+            " class. ",
+            "Only the changed text, attributes and list items should be updated, "
+            "and setting the same props again should not send any messages.",
+        ),
+        Row(
+            Button("Add item").onclick(lambda: view.set_props(view.props + (items[len(view.props) % len(items)],))),
+            Button("Remove item").onclick(lambda: view.set_props(view.props[:-1])),
+            Button("Same props").onclick(lambda: view.set_props(tuple(view.props))),
+        ).style({"gap": "8px"}),
+        view := Component(todo_list, tuple(items[:2])),
+        P("Swapping an element between text siblings should keep the order of the text and the element."),
+        Button("Toggle highlight").onclick(lambda: highlight.set_props(not highlight.props)),
+        highlight := Component(status, False),
+        P("The title component below is reused by each render, and should keep its own count."),
+        Row(
+            Button("Next score").onclick(lambda: score.set_props(score.props + 1)),
+            Button("Rename title").onclick(lambda: title.set_props(title.props + 1)),
+        ).style({"gap": "8px"}),
+        score := Component(scoreboard(title := Component(lambda n: Code(f"Title #{n}"), 1)), 0),
+    )
@@ -1,5 +1,6 @@
 from slash.core import Elem
 from slash.html import Code, Details, Div, P, Summary
+from slash.layout import Lazy
 
 
 def test_details() -> Elem:
@@ -14,4 +15,13 @@ def test_details() -> Elem:
                 "Est deserunt inventore at ut ipsam."
             ),
         ),
+        Details(
+            Summary("Click to expand lazily mounted contents!"),
+            Lazy(
+                lambda: P(
+                    "Sed ut perspiciatis unde omnis iste natus error sit voluptatem. "
+                    "Nemo enim ipsam voluptatem quia voluptas sit aspernatur aut odit aut fugit."
+                )
+            ),
+        ),
     )
@@ -1,6 +1,6 @@
 from slash.core import Elem
 from slash.html import Button, Code, Dialog, Div, P, Span
-from slash.layout import Column, Row
+from slash.layout import Column, Lazy, Row
 
 
 def test_dialog() -> Elem:
@@ -10,6 +10,7 @@ def test_dialog() -> Elem:
             Row(
                 Button("Dialog.show()").onclick(lambda: dialog.show()).style({"font-family": "monospace"}),
                 Button("Dialog.show_modal()").onclick(lambda: dialog.show_modal()).style({"font-family": "monospace"}),
+                Button("Lazy dialog").onclick(lambda: lazy_dialog.show_modal()),
             ).style({"gap": "8px"}),
             dialog := Dialog(
                 Column(
@@ -17,5 +18,13 @@ def test_dialog() -> Elem:
                     Button("Close").onclick(lambda: dialog.close()),
                 ).style({"gap": "16px"})
             ),
+            lazy_dialog := Dialog(
+                Lazy(
+                    lambda: Column(
+                        Span("The contents of this dialog are mounted when it is shown!"),
+                        Button("Close").onclick(lambda: lazy_dialog.close()),
+                    ).style({"gap": "16px"})
+                )
+            ),
         ),
     )
@@ -0,0 +1,50 @@
+import random
+
+from slash.basic._keyed_list import KeyedList
+from slash.core import Elem
+from slash.html import Button, Code, Div, P
+from slash.layout import Column, Row
+
+
+def test_keyed_list() -> Elem:
+    state = {"next": 5}
+
+    def add() -> None:
+        position = random.randint(0, len(numbers.items))
+        items = list(numbers.items)
+        items.insert(position, state["next"])
+        state["next"] += 1
+        numbers.set_items(items)
+
+    def remove() -> None:
+        if numbers.items:
+            items = list(numbers.items)
+            items.pop(random.randrange(len(items)))
+            numbers.set_items(items)
+
+    def shuffle() -> None:
+        numbers.set_items(random.sample(numbers.items, len(numbers.items)))
+
+    return Column(
+        P(
+            "This page tests the ",
+            Code("KeyedList"),
+            " element. ",
+            "When the list is updated, existing items should keep their color, ",
+            "and only the items that moved should be moved in the DOM.",
+        ),
+        Row(
+            Button("Add").onclick(add),
+            Button("Remove").onclick(remove),
+            Button("Shuffle").onclick(shuffle),
+            Button("Sort").onclick(lambda: numbers.set_items(sorted(numbers.items))),
+            Button("Reverse").onclick(lambda: numbers.set_items(reversed(numbers.items))),
+        ).style({"gap": "8px"}),
+        numbers := KeyedList(
+            range(5),
+            key=lambda n: n,
+            render=lambda n: Div(f"Item {n}").style(
+                {"padding": "4px 8px", "background-color": f"hsl({random.randint(0, 359)}, 60%, 80%)"}
+            ),
+        ).style({"display": "flex", "flex-direction": "column", "gap": "4px"}),
+    ).style({"gap": "16px"})
@@ -1,16 +1,20 @@
+import asyncio
+import random
 from typing import Any
 
 from slash.core import Elem
-from slash.html import Code, Div, Input, P
-from slash.reactive import Computed, Signal
+from slash.html import Button, Code, Div, Input, Li, P, Span
+from slash.reactive import Computed, Effect, Resource, Signal, SignalList, batch, bind_text
 
 
 def input_for_signal(type: str, signal: Signal[Any]) -> Input:
-    return (
-        Input(type, value=str(signal.get()))
+    input = (
+        Input(type)
         .style({"width": "64px", "text-align": "center"})
         .oninput(lambda event: signal.set(int(event.value) if event.value else 0))
     )
+    Effect(lambda: input.set_value(str(signal())))
+    return input
 
 
 def test_reactive() -> Elem:
@@ -24,6 +28,26 @@ def test_reactive() -> Elem:
     cat_emojis = Computed(lambda: "🐱" * cats())
     all_emojis = Computed(lambda: cow_emojis() + pig_emojis() + cat_emojis())
 
+    visitors = SignalList(["Alice", "Bob"])
+    names = ["Carol", "Dave", "Erin", "Frank", "Grace", "Heidi"]
+
+    def add_visitor() -> None:
+        visitors.append(next((name for name in names if name not in visitors), f"Visitor {len(visitors) + 1}"))
+
+    query = Signal("")
+
+    async def search(text: str) -> list[str]:
+        await asyncio.sleep(random.uniform(0.1, 1.0))  # results may arrive out of order
+        return [name for name in ["cow", "pig", "cat", "horse", "sheep", "goat"] if text.lower() in name]
+
+    results = Resource(query, search, initial=[])
+
+    @batch()
+    def reset() -> None:
+        cows.set(2)
+        pigs.set(3)
+        cats.set(5)
+
     return Div(
         P("This page tests the ", Code("slash.reactive"), " functionality."),
         P(
@@ -40,4 +64,17 @@ def test_reactive() -> Elem:
         ),
         P("John's farm looks as follows. "),
         P(all_emojis.to_elem().style({"font-size": "1.5rem"})),
+        Button("Reset").onclick(reset),
+        P("Today, John's farm was visited by:"),
+        visitors.to_keyed_list(lambda name: Li(name), key=lambda name: name, tag="ul"),
+        Div(
+            Button("Add visitor").onclick(add_visitor),
+            Button("Remove first visitor").onclick(lambda: visitors.pop(0) if visitors else None),
+        ),
+        P(
+            "Search animals: ",
+            Input().oninput(lambda event: query.set(event.value)),
+            bind_text(Span(), results.loading, lambda loading: " searching ..." if loading else ""),
+        ),
+        P(bind_text(Span(), results.value, lambda names: ", ".join(names or []) or "No results")),
     )
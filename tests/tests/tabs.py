@@ -18,4 +18,14 @@ def test_tabs() -> Elem:
             ["Tab 1", "Tab 2", "Tab 3"],
         ).onchange(lambda event: set_tab(event.value)),
         content := Div().style({"padding": "8px"}).onmount(lambda: set_tab(tabs.value)),
+        P("The panels of the tabs below are only mounted once their tab is selected."),
+        lazy_tabs := Tabs(
+            ["Tab 1", "Tab 2", "Tab 3"],
+            panels={
+                "Tab 1": lambda: "This is the first lazy tab!",
+                "Tab 2": lambda: "Welcome to the second lazy tab!",
+                "Tab 3": lambda: "You made it to the third lazy tab!",
+            },
+        ),
+        lazy_tabs.panels.style({"padding": "8px"}),
     )
@@ -0,0 +1,20 @@
+from slash.basic._virtual_list import VirtualList
+from slash.core import Elem
+from slash.html import Button, Code, Div, P, Span
+from slash.layout import Row
+
+
+def test_virtual_list() -> Elem:
+    def render(index: int) -> Elem:
+        return Div(Span(f"Row {index}")).style(
+            {"padding": "0px 8px", "line-height": "32px", "border-bottom": "1px solid var(--border-muted)"}
+        )
+
+    return Div(
+        P("This page tests the ", Code("VirtualList"), " element. Only the visible rows are mounted."),
+        Row(
+            Button("100 rows").onclick(lambda: rows.set_count(100)),
+            Button("100000 rows").onclick(lambda: rows.set_count(100_000)),
+        ).style({"gap": "8px", "margin-bottom": "8px"}),
+        rows := VirtualList(100_000, row_height=32, render=render),
+    )